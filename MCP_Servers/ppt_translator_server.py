@@ -15,18 +15,40 @@ import dotenv
 import base64
 import argparse
 import json
+import asyncio
+import copy
+import hashlib
+import itertools
+import math
+import posixpath
+import shutil
+import sqlite3
+import struct
+import threading
+import time
+import uuid
+import weakref
+import zipfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import random
+import re
+import httpx
+import openai
 
 # Import OpenAI API
 from langchain_openai import ChatOpenAI
 
 # Import MCP related modules
 from mcp.server.fastmcp import FastMCP
+from starlette.responses import FileResponse, JSONResponse
 
 # Finally, import python-pptx related modules
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.enum.dml import MSO_THEME_COLOR_INDEX
 from pptx.dml.color import RGBColor
+from lxml import etree
 
 # Load environment variables
 dotenv.load_dotenv()
@@ -34,13 +56,121 @@ dotenv.load_dotenv()
 # Define output path
 OUTPUT_PATH = 'output'
 
+# Batched translation budget per request: estimated input tokens (set PPT_BATCH_MAX_INPUT_TOKENS=0 to
+# translate one run per call), expected output tokens and number of texts
+BATCH_MAX_INPUT_TOKENS = int(os.getenv("PPT_BATCH_MAX_INPUT_TOKENS", "1500"))
+BATCH_MAX_OUTPUT_TOKENS = int(os.getenv("PPT_BATCH_MAX_OUTPUT_TOKENS", "4000"))
+BATCH_MAX_ITEMS = int(os.getenv("PPT_BATCH_MAX_ITEMS", "100"))
+# Expected output tokens per input token, leaving room for target languages that need more tokens
+OUTPUT_TOKEN_RATIO = float(os.getenv("PPT_OUTPUT_TOKEN_RATIO", "1.5"))
+
+# Translate multi-run paragraphs in one call with inline span markers instead of run by run
+PARAGRAPH_MODE = os.getenv("PPT_PARAGRAPH_MODE", "false").lower() == "true"
+
+# Maximum number of translation requests in flight at the same time, across all target languages and jobs
+MAX_CONCURRENCY = int(os.getenv("PPT_MAX_CONCURRENCY", "4"))
+
+# Model used for translation and translation memory settings
+TRANSLATION_MODEL = os.getenv("MODEL", "gpt-4o-mini")
+# Bump whenever the translation prompts change so stale cached translations are not reused
+PROMPT_VERSION = "2"
+TM_MAX_ENTRIES = int(os.getenv("PPT_TM_MAX_ENTRIES", "100000"))
+
+# Translation modes: 'final' is the careful default, 'draft' trades polish for speed on internal
+# previews with a cheaper model, larger batches and no per-run retries of failed batches
+TRANSLATION_MODES = ('final', 'draft')
+# Cheaper model of draft mode; when unset, drafts fall back to MODEL and only gain the larger batches
+DRAFT_MODEL = os.getenv("PPT_DRAFT_MODEL", "").strip() or None
+DRAFT_BATCH_MAX_INPUT_TOKENS = int(os.getenv("PPT_DRAFT_BATCH_MAX_INPUT_TOKENS", "6000"))
+DRAFT_BATCH_MAX_OUTPUT_TOKENS = int(os.getenv("PPT_DRAFT_BATCH_MAX_OUTPUT_TOKENS", "12000"))
+DRAFT_BATCH_MAX_ITEMS = int(os.getenv("PPT_DRAFT_BATCH_MAX_ITEMS", "400"))
+
+# Translation backend: 'openai' (OpenAI-compatible chat API), 'dictionary' (offline word list stand-in)
+# or 'replay' (translations recorded from earlier runs)
+TRANSLATION_BACKEND = os.getenv("PPT_TRANSLATION_BACKEND", "openai").lower()
+# JSON file mapping each target language to {source text or word: translation}, used by the dictionary backend
+DICTIONARY_PATH = os.getenv("PPT_DICTIONARY_PATH", "")
+# JSONL file of translations read by the replay backend; OpenAI responses are appended to it when
+# PPT_RECORD_TRANSLATIONS=true
+REPLAY_PATH = os.getenv("PPT_REPLAY_PATH", os.path.join(OUTPUT_PATH, 'recorded_translations.jsonl'))
+RECORD_TRANSLATIONS = os.getenv("PPT_RECORD_TRANSLATIONS", "false").lower() == "true"
+
+# Connection pool shared by all translation calls
+HTTP_MAX_CONNECTIONS = int(os.getenv("PPT_HTTP_MAX_CONNECTIONS", "10"))
+HTTP_REQUEST_TIMEOUT = float(os.getenv("PPT_HTTP_REQUEST_TIMEOUT", "60"))
+
+# Provider rate limits (0 disables a budget) and retry policy for HTTP 429 responses
+RATE_LIMIT_RPM = int(os.getenv("PPT_RATE_LIMIT_RPM", "0"))
+RATE_LIMIT_TPM = int(os.getenv("PPT_RATE_LIMIT_TPM", "0"))
+RATE_LIMIT_MAX_RETRIES = int(os.getenv("PPT_RATE_LIMIT_MAX_RETRIES", "5"))
+RATE_LIMIT_BASE_DELAY = float(os.getenv("PPT_RATE_LIMIT_BASE_DELAY", "1.0"))
+
+# Asynchronous translation jobs: number of jobs run in parallel and how long finished jobs are kept
+JOB_WORKERS = int(os.getenv("PPT_JOB_WORKERS", "2"))
+JOB_RETENTION = float(os.getenv("PPT_JOB_RETENTION_HOURS", "24")) * 3600
+
+# Out-of-band file transfer through the /files upload and download routes
+FILE_STORE_PATH = os.path.join(OUTPUT_PATH, 'files')
+FILE_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("PPT_MAX_UPLOAD_MB", "200")) * 1024 * 1024
+FILE_RETENTION = float(os.getenv("PPT_FILE_RETENTION_HOURS", "24")) * 3600
+
+# Whole-document cache of translated decks, keyed by content hash
+DOC_CACHE_PATH = os.path.join(OUTPUT_PATH, 'document_cache')
+DOC_CACHE_MAX_BYTES = int(os.getenv("PPT_DOC_CACHE_MAX_MB", "500")) * 1024 * 1024
+DOC_CACHE_MAX_AGE = float(os.getenv("PPT_DOC_CACHE_MAX_AGE_HOURS", "168")) * 3600
+
+# Translated decks, one directory per translation call, kept as long as file handles and finished jobs
+RESULT_PATH = os.path.join(OUTPUT_PATH, 'results')
+RESULT_RETENTION = max(FILE_RETENTION, JOB_RETENTION)
+
+# Append-only journals of completed translations, used to resume interrupted decks
+JOURNAL_PATH = os.path.join(OUTPUT_PATH, 'journals')
+JOURNAL_MAX_AGE = float(os.getenv("PPT_JOURNAL_MAX_AGE_HOURS", "72")) * 3600
+
+# Partially translated preview decks written while a job runs, every PPT_PREVIEW_INTERVAL_SECONDS (0 disables)
+PREVIEW_PATH = os.path.join(OUTPUT_PATH, 'previews')
+PREVIEW_INTERVAL = float(os.getenv("PPT_PREVIEW_INTERVAL_SECONDS", "30"))
+
+# Worker threads for blocking python-pptx parsing and saving, and event loop lag sampling interval
+PPTX_EXECUTOR_WORKERS = int(os.getenv("PPT_EXECUTOR_WORKERS", "2"))
+LOOP_LAG_INTERVAL = 0.1
+pptx_executor = ThreadPoolExecutor(max_workers=PPTX_EXECUTOR_WORKERS, thread_name_prefix="pptx")
+
+# Assumed seconds per translation request for estimates, until the server has observed real latency
+ESTIMATE_REQUEST_SECONDS = float(os.getenv("PPT_ESTIMATE_REQUEST_SECONDS", "10"))
+
+# Deck engine: 'pptx' (python-pptx object model), 'xml' (streaming XML rewrite of the text parts)
+# or 'auto' (streaming XML for decks of at least PPT_XML_ENGINE_MIN_MB)
+PPT_ENGINE = os.getenv("PPT_ENGINE", "auto").lower()
+XML_ENGINE_MIN_BYTES = int(os.getenv("PPT_XML_ENGINE_MIN_MB", "50")) * 1024 * 1024
+
+# Translate the text of slide masters and layouts, once per deck
+TRANSLATE_MASTERS = os.getenv("PPT_TRANSLATE_MASTERS", "true").lower() == "true"
+
+# Namespaced tags read from raw DrawingML, chart and package XML
+A_P = '{http://schemas.openxmlformats.org/drawingml/2006/main}p'
+A_R = '{http://schemas.openxmlformats.org/drawingml/2006/main}r'
+A_T = '{http://schemas.openxmlformats.org/drawingml/2006/main}t'
+C_CAT = '{http://schemas.openxmlformats.org/drawingml/2006/chart}cat'
+C_TX = '{http://schemas.openxmlformats.org/drawingml/2006/chart}tx'
+C_STR_CACHE = '{http://schemas.openxmlformats.org/drawingml/2006/chart}strCache'
+C_STR_LIT = '{http://schemas.openxmlformats.org/drawingml/2006/chart}strLit'
+C_MULTI_LVL_STR_CACHE = '{http://schemas.openxmlformats.org/drawingml/2006/chart}multiLvlStrCache'
+C_PT = '{http://schemas.openxmlformats.org/drawingml/2006/chart}pt'
+C_V = '{http://schemas.openxmlformats.org/drawingml/2006/chart}v'
+P_SLD_ID = '{http://schemas.openxmlformats.org/presentationml/2006/main}sldId'
+R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+REL_TAG = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
 # Create MCP server
 mcp = FastMCP("PPTTranslatorServer")
 
 # Parse command line arguments
 parser = argparse.ArgumentParser(description='PPT Translator MCP Server')
 parser.add_argument('--port', type=int, default=8003, help='Server listening port (default: 8003)')
-args = parser.parse_args()
+# Ignore unknown arguments so the module can be imported by other scripts, e.g. the benchmark
+args = parser.parse_known_args()[0]
 
 # Set environment variable for FastMCP to use the specified port
 os.environ["MCP_SSE_PORT"] = str(args.port)
@@ -155,30 +285,394 @@ def apply_run_properties(run, properties):
     if properties['fill'] and hasattr(font, 'fill'):
         apply_color_properties(font.fill.fore_color, properties['fill'])
 
-async def translate_text(text: str, olang: str, tlang: str, ctx=None) -> str:
-    """Translate text using ChatGPT.
+class TranslationMemory:
+    """Disk-backed translation memory stored in SQLite.
 
-    Args:
-        text (str): Text to be translated
-        olang (str): Original language code
-        tlang (str): Target language code
-        ctx: MCP context object (no longer used)
+    Entries are keyed by normalized source text, language pair, model and prompt version,
+    and evicted least-recently-used first once ``max_entries`` is exceeded. A second table
+    keeps the translated units of whole slides keyed by their source fingerprint, so an
+    unchanged slide of a revised deck can be spliced in without translating it again.
+    """
 
-    Returns:
-        str: Translated text
+    def __init__(self, db_path: str, max_entries: int):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open the database on first use."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS translations (
+                    key TEXT PRIMARY KEY,
+                    translation TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON translations (last_used)")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS slide_translations (
+                    key TEXT PRIMARY KEY,
+                    translation TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_slide_last_used ON slide_translations (last_used)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize source text so trivially different whitespace shares an entry."""
+        return ' '.join(text.split())
+
+    def make_key(self, text: str, olang: str, tlang: str, model: str) -> str:
+        """Build the cache key for a source text."""
+        raw = '\x1f'.join([self.normalize(text), olang.strip().lower(), tlang.strip().lower(), model, PROMPT_VERSION])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _get_many(self, table: str, keys: list) -> dict:
+        """Return the stored values of keys found, marking them as recently used in one transaction."""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            # Stay below SQLite's limit on the number of query parameters
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT key, translation FROM {table} WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                conn.executemany(f"UPDATE {table} SET last_used = ? WHERE key = ?", [(now, key) for key in found])
+                conn.commit()
+        return found
+
+    def _get(self, table: str, key: str):
+        """Return the stored value of a key and mark it as recently used, or None on a miss."""
+        return self._get_many(table, [key]).get(key)
+
+    def _contains(self, table: str, key: str) -> bool:
+        """Return whether a key is stored, leaving its last use untouched."""
+        with self._lock:
+            row = self._connect().execute(f"SELECT 1 FROM {table} WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def _put_many(self, table: str, values: list) -> None:
+        """Store (key, value) pairs in one transaction and evict the least recently used entries over the size bound."""
+        if not values:
+            return
+        with self._lock:
+            conn = self._connect()
+            now = time.time()
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (key, translation, last_used) VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in values]
+            )
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            if count > self.max_entries:
+                conn.execute(
+                    f"DELETE FROM {table} WHERE key IN "
+                    f"(SELECT key FROM {table} ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+            conn.commit()
+
+    def _put(self, table: str, key: str, value: str) -> None:
+        """Store a value and evict the least recently used entries over the size bound."""
+        self._put_many(table, [(key, value)])
+
+    def get(self, text: str, olang: str, tlang: str, model: str):
+        """Return the cached translation, or None on a miss."""
+        translation = self._get('translations', self.make_key(text, olang, tlang, model))
+        if translation is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return translation
+
+    def get_many(self, texts: list, olang: str, tlang: str, model: str) -> list:
+        """Return the cached translation of each text, or None on a miss, with one database transaction."""
+        keys = [self.make_key(text, olang, tlang, model) for text in texts]
+        found = self._get_many('translations', keys)
+        translations = [found.get(key) for key in keys]
+        self.hits += sum(1 for translation in translations if translation is not None)
+        self.misses += sum(1 for translation in translations if translation is None)
+        return translations
+
+    def contains(self, text: str, olang: str, tlang: str, model: str) -> bool:
+        """Return whether a translation is cached, without counting a hit or refreshing it."""
+        return self._contains('translations', self.make_key(text, olang, tlang, model))
+
+    def peek(self, text: str, olang: str, tlang: str, model: str):
+        """Return the cached translation, or None, without counting a hit or refreshing it."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT translation FROM translations WHERE key = ?", (self.make_key(text, olang, tlang, model),)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, text: str, olang: str, tlang: str, model: str, translation: str) -> None:
+        """Store a translation and evict the least recently used entries over the size bound."""
+        self._put('translations', self.make_key(text, olang, tlang, model), translation)
+
+    def put_many(self, texts: list, olang: str, tlang: str, model: str, translations: list) -> None:
+        """Store the translations of several texts with one database transaction and eviction check."""
+        self._put_many('translations', [(self.make_key(text, olang, tlang, model), translation)
+                                        for text, translation in zip(texts, translations)])
+
+    def get_slides(self, fingerprints: list, olang: str, tlang: str, model: str) -> list:
+        """Return the stored translation of each slide fingerprint, or None, with one database transaction."""
+        keys = [self.make_key(fingerprint, olang, tlang, model) for fingerprint in fingerprints]
+        found = self._get_many('slide_translations', keys)
+        return [json.loads(found[key]) if key in found else None for key in keys]
+
+    def contains_slide(self, fingerprint: str, olang: str, tlang: str, model: str) -> bool:
+        """Return whether a slide with this source fingerprint is stored, without refreshing it."""
+        return self._contains('slide_translations', self.make_key(fingerprint, olang, tlang, model))
+
+    def put_slides(self, fingerprints: list, olang: str, tlang: str, model: str, translations: list) -> None:
+        """Store the translations of several slides under their source fingerprints with one transaction."""
+        self._put_many('slide_translations', [
+            (self.make_key(fingerprint, olang, tlang, model), json.dumps(translation, ensure_ascii=False))
+            for fingerprint, translation in zip(fingerprints, translations)
+        ])
+
+    def clear(self) -> None:
+        """Remove every cached translation."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM translations")
+            conn.execute("DELETE FROM slide_translations")
+            conn.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+
+# Shared translation memory used by all translation calls
+translation_memory = TranslationMemory(os.path.join(OUTPUT_PATH, 'translation_memory.db'), TM_MAX_ENTRIES)
+
+# Shared HTTP client and chat models, built lazily on first use
+_http_client = None
+_chat_models = {}
+# Number of HTTP requests sent and new TCP connections opened by the shared client
+http_stats = {'requests': 0, 'connections': 0}
+
+async def _trace_connection(event_name: str, info: dict) -> None:
+    """httpcore trace hook counting newly opened connections."""
+    if event_name == 'connection.connect_tcp.complete':
+        http_stats['connections'] += 1
+
+async def _on_http_request(request) -> None:
+    """httpx request hook counting requests and attaching the connection trace."""
+    http_stats['requests'] += 1
+    request.extensions['trace'] = _trace_connection
+
+def get_http_client():
+    """Return the pooled HTTP client shared by all translation calls."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(HTTP_REQUEST_TIMEOUT),
+            event_hooks={'request': [_on_http_request]},
+        )
+    return _http_client
+
+def get_chat_model(model_name: str = None):
+    """Return the shared ChatOpenAI instance for a model, creating it on first use."""
+    model_name = model_name or TRANSLATION_MODEL
+    model = _chat_models.get(model_name)
+    if model is None:
+        model = ChatOpenAI(
+            model=model_name,
+            temperature=0,
+            request_timeout=HTTP_REQUEST_TIMEOUT,
+            # Rate-limit retries are handled by request_scheduler
+            max_retries=0,
+            http_async_client=get_http_client(),
+        )
+        _chat_models[model_name] = model
+    return model
+
+def get_connection_stats() -> dict:
+    """Return request and connection counters of the shared HTTP client."""
+    requests = http_stats['requests']
+    connections = http_stats['connections']
+    return {
+        'requests': requests,
+        'connections': connections,
+        'reused': max(0, requests - connections),
+    }
+
+def get_mode_model(mode: str) -> str:
+    """Return the model used by a translation mode, falling back to MODEL for drafts without PPT_DRAFT_MODEL."""
+    if mode == 'draft' and DRAFT_MODEL:
+        return DRAFT_MODEL
+    return TRANSLATION_MODEL
+
+def get_cache_model(mode: str, backend: str = None) -> str:
+    """Return the model identifier that translations of a mode and backend are cached under.
+
+    Draft translations and translations of the offline backends share the translation memory
+    with final ones, but are keyed apart so they are never served as a final translation.
     """
-    if not text.strip():
-        return text
+    backend = backend or TRANSLATION_BACKEND
+    model = get_mode_model(mode) if backend == 'openai' else backend
+    return model if mode == 'final' else f"{model}:{mode}"
 
-    print(f"\nTranslating text:")
-    print(f"Original ({olang}): {text}")
+def get_mode_batch_limits(mode: str) -> tuple:
+    """Return the (max input tokens, max output tokens, max items) batch budget of a translation mode."""
+    if mode == 'draft':
+        return DRAFT_BATCH_MAX_INPUT_TOKENS, DRAFT_BATCH_MAX_OUTPUT_TOKENS, DRAFT_BATCH_MAX_ITEMS
+    return BATCH_MAX_INPUT_TOKENS, BATCH_MAX_OUTPUT_TOKENS, BATCH_MAX_ITEMS
 
-    try:
-        # Create ChatGPT model
-        model = ChatOpenAI(temperature=0)
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text without a tokenizer.
+
+    ASCII text averages about four characters per token, while CJK and other non-ASCII
+    characters are closer to one token each.
+    """
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return max(1, ascii_chars // 4 + (len(text) - ascii_chars))
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Return True if an exception is an HTTP 429 from the provider."""
+    if isinstance(error, openai.RateLimitError):
+        return True
+    return getattr(error, 'status_code', None) == 429
+
+class RequestScheduler:
+    """Token-bucket scheduler placed in front of every translation LLM call.
+
+    Keeps separate request and token budgets per minute, waits until both buckets can
+    cover a call before dispatching it, and retries rate-limited calls with jittered
+    exponential backoff.
+    """
 
-        # Create system prompt
-        system_message = f"""You are a professional translator. Translate the following text from {olang} to {tlang}.
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_retries: int, base_delay: float):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.request_budget = float(requests_per_minute)
+        self.token_budget = float(tokens_per_minute)
+        self.last_refill = time.monotonic()
+        self.stats = {'requests': 0, 'retries': 0, 'wait_time': 0.0, 'dropped': 0,
+                      'completed': 0, 'latency_total': 0.0}
+        self._lock = None
+
+    def _refill(self) -> None:
+        """Refill both buckets for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        if self.requests_per_minute > 0:
+            self.request_budget = min(self.requests_per_minute,
+                                      self.request_budget + elapsed * self.requests_per_minute / 60)
+        if self.tokens_per_minute > 0:
+            self.token_budget = min(self.tokens_per_minute,
+                                    self.token_budget + elapsed * self.tokens_per_minute / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until the request and token budgets can cover one call of ``tokens`` tokens."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.tokens_per_minute > 0:
+                # A single oversized call can never wait for more than a full bucket
+                tokens = min(tokens, self.tokens_per_minute)
+
+            while True:
+                self._refill()
+                wait = 0.0
+                if self.requests_per_minute > 0 and self.request_budget < 1:
+                    wait = max(wait, (1 - self.request_budget) * 60 / self.requests_per_minute)
+                if self.tokens_per_minute > 0 and self.token_budget < tokens:
+                    wait = max(wait, (tokens - self.token_budget) * 60 / self.tokens_per_minute)
+                if wait <= 0:
+                    break
+                self.stats['wait_time'] += wait
+                await asyncio.sleep(wait)
+
+            if self.requests_per_minute > 0:
+                self.request_budget -= 1
+            if self.tokens_per_minute > 0:
+                self.token_budget -= tokens
+
+    async def invoke(self, model, messages: list, estimated_tokens: int, item_count: int = 1):
+        """Call ``model.ainvoke`` within the rate limits, retrying HTTP 429 responses.
+
+        Args:
+            model: Chat model to call
+            messages (list): Messages passed to the model
+            estimated_tokens (int): Estimated prompt plus completion tokens of the call
+            item_count (int): Number of work items carried by the call, for the dropped counter
+
+        Returns:
+            The model response
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.acquire(estimated_tokens)
+            self.stats['requests'] += 1
+            started = time.monotonic()
+            try:
+                response = await model.ainvoke(messages)
+                self.stats['completed'] += 1
+                self.stats['latency_total'] += time.monotonic() - started
+                return response
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    # The call is given up, its items are counted as dropped once
+                    self.stats['dropped'] += item_count
+                    raise
+
+                delay = self.base_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+                # Honour the provider's Retry-After hint when it asks for a longer pause
+                response = getattr(e, 'response', None)
+                retry_after = response.headers.get('retry-after') if response is not None else None
+                try:
+                    delay = max(delay, float(retry_after))
+                except (TypeError, ValueError):
+                    pass
+
+                print(f"[Warning] Rate limited, retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})")
+                self.stats['retries'] += 1
+                self.stats['wait_time'] += delay
+                await asyncio.sleep(delay)
+
+# Shared scheduler for all translation LLM calls
+request_scheduler = RequestScheduler(RATE_LIMIT_RPM, RATE_LIMIT_TPM, RATE_LIMIT_MAX_RETRIES, RATE_LIMIT_BASE_DELAY)
+
+# Semaphore of MAX_CONCURRENCY request slots shared by every translate_texts call, per event loop
+_request_slots = weakref.WeakKeyDictionary()
+
+def get_request_slots() -> asyncio.Semaphore:
+    """Return the semaphore bounding translation requests in flight across all languages and jobs."""
+    loop = asyncio.get_running_loop()
+    if loop not in _request_slots:
+        _request_slots[loop] = asyncio.Semaphore(max(1, MAX_CONCURRENCY))
+    return _request_slots[loop]
+
+def build_system_message(olang: str, tlang: str) -> str:
+    """Build the system prompt shared by single and batched translation calls."""
+    return f"""You are a professional translator. Translate the following text from {olang} to {tlang}.
         Rules:
         1. Keep all formatting symbols (like bullet points, numbers) unchanged
         2. Keep all special characters unchanged
@@ -188,192 +682,1760 @@ async def translate_text(text: str, olang: str, tlang: str, ctx=None) -> str:
         6. Do not add any explanations or notes
         7. Keep all numbers and dates unchanged
         8. Keep all proper nouns unchanged unless they have standard translations
+        9. Keep inline markers such as <s1>...</s1> and place each translated fragment inside its marker;
+           markers may be reordered when the target language requires it
         """
 
-        # Create message list
-        messages = [
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": text}
+def build_translation_messages(texts: list, olang: str, tlang: str) -> list:
+    """Build the chat messages translating one text, or a numbered JSON batch of several texts."""
+    if len(texts) == 1:
+        return [
+            {"role": "system", "content": build_system_message(olang, tlang)},
+            {"role": "user", "content": texts[0]}
         ]
 
+    system_message = build_system_message(olang, tlang) + """
+        The input is a JSON object mapping item numbers to texts.
+        Return ONLY a JSON object with exactly the same keys, where each value is the translation of the corresponding text.
+        Translate every item independently and never merge, split, or drop items.
+        """
+    payload = {str(i): text for i, text in enumerate(texts, 1)}
+    return [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": json.dumps(payload, ensure_ascii=False)}
+    ]
+
+def estimate_request_tokens(messages: list) -> int:
+    """Estimate the prompt plus completion tokens of a translation call."""
+    # The completion is about as long as the text being translated
+    return estimate_tokens(messages[0]["content"]) + 2 * estimate_tokens(messages[1]["content"])
+
+async def translate_text(text: str, olang: str, tlang: str, ctx=None, use_cache: bool = True,
+                         failed: set = None, mode: str = 'final', backend: str = None) -> str:
+    """Translate text using the translation backend.
+
+    Args:
+        text (str): Text to be translated
+        olang (str): Original language code
+        tlang (str): Target language code
+        ctx: MCP context object (no longer used)
+        use_cache (bool): Whether to consult and update the translation memory
+        failed (set): Optional set the text is added to when the translation fails
+        mode (str): Translation mode, 'final' or 'draft'
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+
+    Returns:
+        str: Translated text
+    """
+    if not text.strip():
+        return text
+
+    if use_cache:
+        cached_text = await run_blocking(translation_memory.get, text, olang, tlang, get_cache_model(mode, backend))
+        if cached_text is not None:
+            return cached_text
+
+    print(f"\nTranslating text:")
+    print(f"Original ({olang}): {text}")
+
+    try:
         # Execute translation
-        response = await model.ainvoke(messages)
-        translated_text = response.content.strip()
+        translations = await get_translation_backend(backend).translate_batch([text], olang, tlang,
+                                                                              get_mode_model(mode))
+        if translations is None:
+            raise ValueError("The translation backend returned no translation")
+        translated_text = translations[0].strip()
+        record_translations(olang, tlang, [text], [translated_text], backend)
 
         print(f"Translation ({tlang}): {translated_text}\n")
+        if use_cache:
+            await run_blocking(translation_memory.put, text, olang, tlang, get_cache_model(mode, backend),
+                               translated_text)
         return translated_text
 
     except Exception as e:
         print(f"Translation failed: {str(e)}")
         if ctx:
             await ctx.info(f"Translation failed: {str(e)}")
+        if failed is not None:
+            failed.add(text)
         # Return original text to ensure content is not lost
         return text
 
-async def translate_group_shape(shape, olang: str, tlang: str, ctx=None) -> None:
-    """Translate all shapes within a group.
+def parse_batch_response(content: str, count: int):
+    """Parse a numbered batch response back into an ordered list of translations.
 
     Args:
-        shape: PowerPoint group shape object
+        content (str): Raw model response, expected to be a JSON object keyed "1".."count"
+        count (int): Number of texts that were sent in the batch
+
+    Returns:
+        list | None: Translations in request order, or None if the response cannot be aligned
+    """
+    content = content.strip()
+    # Models occasionally wrap JSON in a markdown code fence
+    if content.startswith("```"):
+        content = content.split("\n", 1)[1] if "\n" in content else ""
+        content = content.rsplit("```", 1)[0]
+
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(data, dict):
+        return None
+
+    expected_keys = {str(i) for i in range(1, count + 1)}
+    if set(data.keys()) != expected_keys:
+        return None
+    if not all(isinstance(value, str) for value in data.values()):
+        return None
+
+    return [data[str(i)] for i in range(1, count + 1)]
+
+class TranslationBackend(ABC):
+    """Service that translates texts, batch first.
+
+    ``translate_batch`` receives one or more texts and returns their translations in the same
+    order, returns None when a response cannot be aligned with the texts, and raises on
+    failure, so the translator pipeline can fall back or mark texts as failed the same way
+    for every backend.
+    """
+
+    name = None
+
+    @abstractmethod
+    async def translate_batch(self, texts: list, olang: str, tlang: str, model_name: str):
+        """Translate texts from ``olang`` to ``tlang``.
+
+        Args:
+            texts (list): Texts to be translated
+            olang (str): Original language code
+            tlang (str): Target language code
+            model_name (str): Model selected by the translation mode, for backends that use one
+
+        Returns:
+            list | None: Translated texts in the same order, or None if the response cannot be aligned
+        """
+
+class OpenAIBackend(TranslationBackend):
+    """OpenAI-compatible chat completion API, called through the shared rate-limited scheduler."""
+
+    name = 'openai'
+
+    async def translate_batch(self, texts: list, olang: str, tlang: str, model_name: str):
+        model = get_chat_model(model_name)
+        messages = build_translation_messages(texts, olang, tlang)
+        response = await request_scheduler.invoke(model, messages, estimate_request_tokens(messages),
+                                                  item_count=len(texts))
+        if len(texts) == 1:
+            return [response.content]
+        return parse_batch_response(response.content, len(texts))
+
+class DictionaryBackend(TranslationBackend):
+    """Offline rule-based stand-in that looks texts and words up in a local dictionary.
+
+    A text found as a whole in the target language's dictionary is replaced by its entry;
+    otherwise each known word is replaced and every other word, span markers included, is
+    kept. Without a dictionary file every text comes back unchanged, which is enough for
+    load tests and CI.
+    """
+
+    name = 'dictionary'
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries = None
+
+    def get_entries(self, tlang: str) -> dict:
+        """Return the lower-cased dictionary of a target language, loading the file on first use."""
+        if self._entries is None:
+            self._entries = {}
+            if self.path:
+                with open(self.path, encoding='utf-8') as f:
+                    for language, entries in json.load(f).items():
+                        self._entries[language.strip().lower()] = {
+                            source.strip().lower(): target for source, target in entries.items()
+                        }
+        return self._entries.get(tlang.strip().lower(), {})
+
+    def translate_text(self, text: str, entries: dict) -> str:
+        """Translate one text with a language's dictionary."""
+        if text.strip().lower() in entries:
+            return entries[text.strip().lower()]
+        return ''.join(
+            piece if MARKER_PATTERN.fullmatch(piece)
+            else re.sub(r'\w+', lambda match: entries.get(match.group().lower(), match.group()), piece)
+            for piece in re.split(r'(</?s\d+>)', text)
+        )
+
+    async def translate_batch(self, texts: list, olang: str, tlang: str, model_name: str):
+        entries = self.get_entries(tlang)
+        return [self.translate_text(text, entries) for text in texts]
+
+class ReplayBackend(TranslationBackend):
+    """Replays translations recorded with PPT_RECORD_TRANSLATIONS, without calling any service.
+
+    A batch containing a text that was never recorded cannot be aligned, so the pipeline
+    retries its texts one by one and marks the missing ones as failed.
+    """
+
+    name = 'replay'
+
+    def __init__(self, path: str):
+        self.path = path
+        self._recordings = None
+
+    def get_recordings(self) -> dict:
+        """Return the recorded translations keyed by (olang, tlang, text), loading the file on first use."""
+        if self._recordings is None:
+            self._recordings = {}
+            if os.path.exists(self.path):
+                with open(self.path, encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        key = (entry['olang'].strip().lower(), entry['tlang'].strip().lower(), entry['text'])
+                        self._recordings[key] = entry['translation']
+        return self._recordings
+
+    async def translate_batch(self, texts: list, olang: str, tlang: str, model_name: str):
+        recordings = self.get_recordings()
+        translations = [recordings.get((olang.strip().lower(), tlang.strip().lower(), text)) for text in texts]
+        if any(translation is None for translation in translations):
+            if len(texts) == 1:
+                raise LookupError(f"No recorded translation for '{texts[0]}'")
+            return None
+        return translations
+
+# Translation backends by name, created on first use
+TRANSLATION_BACKENDS = {
+    'openai': OpenAIBackend,
+    'dictionary': lambda: DictionaryBackend(DICTIONARY_PATH),
+    'replay': lambda: ReplayBackend(REPLAY_PATH),
+}
+_backends = {}
+
+def get_translation_backend(name: str = None) -> TranslationBackend:
+    """Return the shared backend instance of a name, defaulting to PPT_TRANSLATION_BACKEND."""
+    name = name or TRANSLATION_BACKEND
+    if name not in _backends:
+        if name not in TRANSLATION_BACKENDS:
+            raise ValueError(f"Unknown translation backend '{name}'")
+        _backends[name] = TRANSLATION_BACKENDS[name]()
+    return _backends[name]
+
+def record_translations(olang: str, tlang: str, texts: list, translations: list, backend: str = None) -> None:
+    """Append translations returned by the OpenAI backend to the replay file when PPT_RECORD_TRANSLATIONS is enabled."""
+    if not RECORD_TRANSLATIONS or (backend or TRANSLATION_BACKEND) != 'openai':
+        return
+    try:
+        os.makedirs(os.path.dirname(REPLAY_PATH) or '.', exist_ok=True)
+        with open(REPLAY_PATH, 'a', encoding='utf-8') as f:
+            for text, translated_text in zip(texts, translations):
+                f.write(json.dumps({'olang': olang, 'tlang': tlang, 'text': text, 'translation': translated_text},
+                                   ensure_ascii=False) + '\n')
+    except OSError as e:
+        print(f"[Warning] Could not record translations: {str(e)}")
+
+async def translate_batch(texts: list, olang: str, tlang: str, ctx=None, mode: str = 'final', backend: str = None):
+    """Translate several texts with a single backend call.
+
+    Args:
+        texts (list): Texts to be translated
         olang (str): Original language code
         tlang (str): Target language code
         ctx: MCP context object
+        mode (str): Translation mode, 'final' or 'draft'
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+
+    Returns:
+        list | None: Translated texts in the same order, or None if the response cannot be aligned
+
+    Raises:
+        Exception: The backend call failed, e.g. rate limit retries exhausted, auth or network error
     """
+    print(f"\n[Batch] Translating {len(texts)} text(s) in one request")
+
     try:
-        if not hasattr(shape, 'shapes'):
-            return
+        translations = await get_translation_backend(backend).translate_batch(texts, olang, tlang,
+                                                                              get_mode_model(mode))
+        if translations is None:
+            print(f"[Warning] Batch response could not be aligned with {len(texts)} item(s)")
+        else:
+            record_translations(olang, tlang, texts, translations, backend)
+        return translations
 
-        # Iterate through all shapes in the group
-        for child_shape in shape.shapes:
-            if child_shape.shape_type == MSO_SHAPE_TYPE.GROUP:
-                # Recursively handle nested groups
-                await translate_group_shape(child_shape, olang, tlang, ctx)
-            else:
-                # Translate individual shape
-                await translate_shape(child_shape, olang, tlang, ctx)
     except Exception as e:
-        print(f"Error translating group shape: {str(e)}")
+        print(f"[Warning] Batch translation failed: {str(e)}")
         if ctx:
-            await ctx.info(f"Error translating group shape: {str(e)}")
+            await ctx.info(f"Batch translation failed: {str(e)}")
         raise
 
-async def translate_shape(shape, olang: str, tlang: str, ctx=None) -> None:
-    """Translate a shape in PowerPoint.
+def estimate_item_tokens(text: str) -> tuple:
+    """Estimate the input and expected output tokens of one text inside a batch request.
+
+    The text is counted as its JSON entry in the request, key and separators included.
+    """
+    input_tokens = estimate_tokens(json.dumps(text, ensure_ascii=False)) + 4
+    return input_tokens, math.ceil(input_tokens * OUTPUT_TOKEN_RATIO)
+
+def get_batch_overhead_tokens(olang: str, tlang: str) -> int:
+    """Estimate the input tokens of the batch prompt sent along with every batch."""
+    return estimate_tokens(build_translation_messages(['', ''], olang, tlang)[0]["content"])
+
+def get_batch_fill(item_count: int, input_tokens: int, output_tokens: int, limits: tuple) -> float:
+    """Return how full a batch is: the largest share it uses of any of its budgets."""
+    max_input, max_output, max_items = limits
+    fill = max(input_tokens / max_input if max_input > 0 else 0.0, item_count / max_items if max_items > 0 else 0.0)
+    if max_output > 0:
+        fill = max(fill, output_tokens / max_output)
+    return fill
+
+def pack_batches(texts: list, limits: tuple = None, groups: list = None, overhead_tokens: int = 0) -> list:
+    """Bin-pack texts into batch requests under the input and expected output token ceilings.
+
+    Texts keep their order. When ``groups`` gives the slide of each text, a slide that does
+    not fit in the rest of a batch that is already at least half full starts a new batch, so
+    the texts of a slide are translated together and give each other context. Slides larger
+    than a batch are split over several batches.
 
     Args:
-        shape: PowerPoint shape object
+        texts (list): Texts to be packed
+        limits (tuple): (max input tokens, max output tokens, max items) per batch, defaults to
+            the budget of the final mode
+        groups (list): Optional slide of each text
+        overhead_tokens (int): Input tokens of the prompt sent along with every batch
+
+    Returns:
+        list: Lists of indices into ``texts``, one list per batch
+    """
+    limits = limits or get_mode_batch_limits('final')
+    max_input, max_output, max_items = limits
+    if max_input <= 0 or max_items <= 1:
+        # Batching disabled, translate one text per call
+        return [[index] for index in range(len(texts))]
+
+    item_tokens = [estimate_item_tokens(text) for text in texts]
+    batches = []
+    current = []
+    used = [overhead_tokens, 0]
+
+    def fits(indices):
+        return (len(current) + len(indices) <= max_items
+                and used[0] + sum(item_tokens[i][0] for i in indices) <= max_input
+                and (max_output <= 0 or used[1] + sum(item_tokens[i][1] for i in indices) <= max_output))
+
+    def close_batch():
+        batches.append(current[:])
+        current.clear()
+        used[:] = [overhead_tokens, 0]
+
+    group_keys = groups if groups is not None else range(len(texts))
+    for _, group in itertools.groupby(range(len(texts)), key=lambda index: group_keys[index]):
+        group = list(group)
+        if current and not fits(group) and get_batch_fill(len(current), used[0], used[1], limits) >= 0.5:
+            close_batch()
+        for index in group:
+            if current and not fits([index]):
+                close_batch()
+            current.append(index)
+            used[0] += item_tokens[index][0]
+            used[1] += item_tokens[index][1]
+    if current:
+        close_batch()
+    return batches
+
+def get_batch_fill_ratios(texts: list, batches: list, limits: tuple = None, overhead_tokens: int = 0) -> list:
+    """Return the fill ratio of each batch produced by pack_batches."""
+    limits = limits or get_mode_batch_limits('final')
+    ratios = []
+    for batch in batches:
+        item_tokens = [estimate_item_tokens(texts[index]) for index in batch]
+        ratios.append(get_batch_fill(len(batch), overhead_tokens + sum(tokens[0] for tokens in item_tokens),
+                                     sum(tokens[1] for tokens in item_tokens), limits))
+    return ratios
+
+async def translate_texts(texts: list, olang: str, tlang: str, ctx=None, progress_callback=None,
+                          use_cache: bool = True, journal=None, failed: set = None, mode: str = 'final',
+                          backend: str = None, groups: list = None, stats: dict = None) -> list:
+    """Translate a list of texts, batching requests when enabled.
+
+    Texts found in the journal or the translation memory are resolved up front. The remaining texts are
+    packed into batches under the mode's token budget, keeping the texts of a slide together, and
+    processed by a pool of asyncio workers that share MAX_CONCURRENCY request slots with every other
+    language and job translating at the same time. Batches
+    whose response cannot be aligned with the input fall back to one call per text, except in
+    draft mode, where they keep the source text and are reported as failed. Batches whose call
+    fails keep the source text and are reported as failed without per-text retries, which would
+    only repeat the failure against a throttling or unreachable provider.
+
+    Args:
+        texts (list): Texts to be translated
         olang (str): Original language code
         tlang (str): Target language code
         ctx: MCP context object
+        progress_callback: Optional async callable receiving (completed, total) text counts
+        use_cache (bool): Whether to consult and update the translation memory
+        journal (TranslationJournal): Optional journal that completed translations are resumed from
+            and appended to
+        failed (set): Optional set that texts whose translation failed are added to
+        mode (str): Translation mode, 'final' or 'draft'
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+        groups (list): Optional slide of each text, used to keep the texts of a slide in one batch
+        stats (dict): Optional dict filled in with the number of batches and their fill ratios
+
+    Returns:
+        list: Translated texts in the same order
     """
-    try:
-        # Handle group shapes
-        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+    cache_model = get_cache_model(mode, backend)
+    translations = list(texts)
+    if not texts:
+        return translations
+
+    pending = []
+    for i, text in enumerate(texts):
+        cached_text = journal.get(text) if journal else None
+        if cached_text is None:
+            pending.append(i)
+        else:
+            translations[i] = cached_text
+    if pending and use_cache:
+        # Look the remaining texts up in the translation memory in one transaction, off the event loop
+        cached_texts = await run_blocking(translation_memory.get_many, [texts[i] for i in pending],
+                                          olang, tlang, cache_model)
+        for i, cached_text in zip(pending, cached_texts):
+            if cached_text is not None:
+                translations[i] = cached_text
+        pending = [i for i, cached_text in zip(pending, cached_texts) if cached_text is None]
+
+    completed = len(texts) - len(pending)
+    if completed and progress_callback:
+        await progress_callback(completed, len(texts))
+    if not pending:
+        return translations
+
+    pending_texts = [texts[i] for i in pending]
+    limits = get_mode_batch_limits(mode)
+    overhead_tokens = get_batch_overhead_tokens(olang, tlang)
+    pending_groups = [groups[i] for i in pending] if groups is not None else None
+    packed = pack_batches(pending_texts, limits, pending_groups, overhead_tokens)
+    fill_ratios = get_batch_fill_ratios(pending_texts, packed, limits, overhead_tokens)
+    print(f"[Info] Packed {len(pending)} text(s) into {len(packed)} request(s), "
+          f"fill ratio avg {sum(fill_ratios) / len(fill_ratios):.2f}, min {min(fill_ratios):.2f}")
+    if stats is not None:
+        stats.update({
+            'batches': len(packed),
+            'batch_fill_avg': round(sum(fill_ratios) / len(fill_ratios), 3),
+            'batch_fill_min': round(min(fill_ratios), 3),
+        })
+    batches = [[pending[j] for j in batch] for batch in packed]
 
-            await translate_group_shape(shape, olang, tlang, ctx)
-            return
+    queue = asyncio.Queue()
+    for batch in batches:
+        queue.put_nowait(batch)
+    if failed is None:
+        failed = set()
+
+    async def worker():
+        nonlocal completed
+        while True:
+            try:
+                batch = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            batch_texts = [texts[i] for i in batch]
+            # One request slot covers the batch call and its per-text fallback
+            async with get_request_slots():
+                batch_translations = None
+                batch_error = False
+                if len(batch_texts) > 1:
+                    try:
+                        batch_translations = await translate_batch(batch_texts, olang, tlang, ctx, mode, backend)
+                    except Exception:
+                        batch_error = True
+                    if batch_translations is not None and use_cache:
+                        await run_blocking(translation_memory.put_many, batch_texts, olang, tlang, cache_model,
+                                           batch_translations)
+
+                if batch_error:
+                    # The backend already gave up on the whole batch, keep the source text
+                    failed.update(batch_texts)
+                    batch_translations = list(batch_texts)
+                elif batch_translations is None and mode == 'draft' and len(batch_texts) > 1:
+                    # Drafts do not retry failed batches text by text, the source text is kept instead
+                    failed.update(batch_texts)
+                    batch_translations = list(batch_texts)
+                elif batch_translations is None:
+                    # Fall back to per-text calls for this batch
+                    batch_translations = [
+                        await translate_text(text, olang, tlang, ctx, use_cache=use_cache, failed=failed, mode=mode,
+                                             backend=backend)
+                        for text in batch_texts
+                    ]
+
+            for i, translated_text in zip(batch, batch_translations):
+                translations[i] = translated_text
+            if journal:
+                journal.record(batch_texts, batch_translations, failed)
+
+            completed += len(batch)
+            if progress_callback:
+                await progress_callback(completed, len(texts))
+
+    worker_count = max(1, min(MAX_CONCURRENCY, len(batches)))
+    await asyncio.gather(*(worker() for _ in range(worker_count)))
+
+    return translations
+
+def collect_group_shape_text(shape, slide_index: int, frames: list) -> None:
+    """Collect the text frames of all shapes within a group.
 
-        # Check if the shape contains a text frame
-        if not hasattr(shape, "text_frame"):
+    Args:
+        shape: PowerPoint group shape object
+        slide_index (int): 1-based index of the slide containing the shape
+        frames (list): List that collected text frame entries are appended to
+    """
+    if not hasattr(shape, 'shapes'):
+        return
 
-            return
+    # Iterate through all shapes in the group
+    for child_shape in shape.shapes:
+        # Nested groups are handled recursively by collect_shape_text
+        collect_shape_text(child_shape, slide_index, frames)
 
-        text_frame = shape.text_frame
-        if not text_frame.text.strip():
+def collect_shape_text(shape, slide_index: int, frames: list) -> None:
+    """Collect the text of a shape together with its formatting snapshot.
 
-            return
+    Each collected text frame entry is a dict holding the text frame, its properties and
+    its paragraphs; each paragraph holds its runs with their original text, properties and
+    a ``translation`` slot that is filled in by the translation pass.
 
-        # Save text frame format
-        text_frame_props = get_text_frame_properties(text_frame)
+    Args:
+        shape: PowerPoint shape object
+        slide_index (int): 1-based index of the slide containing the shape
+        frames (list): List that collected text frame entries are appended to
+    """
+    # Handle group shapes
+    if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+        collect_group_shape_text(shape, slide_index, frames)
+        return
 
-        # Iterate through all paragraphs
-        paragraph_count = len(text_frame.paragraphs)
+    # Table cells and charts are collected into the same batched queue as ordinary text
+    if shape.has_table:
+        for row in shape.table.rows:
+            for cell in row.cells:
+                collect_text_frame(cell.text_frame, slide_index, frames)
+        return
+    if shape.has_chart:
+        collect_chart_text(shape.chart, slide_index, frames)
+        return
 
-        for i, paragraph in enumerate(text_frame.paragraphs, 1):
-            # Save paragraph format
-            para_props = get_paragraph_properties(paragraph)
+    # Check if the shape contains a text frame
+    if not hasattr(shape, "text_frame"):
+        return
 
-            # Iterate through all text runs
-            runs_data = []
-            run_count = len(paragraph.runs)
+    collect_text_frame(shape.text_frame, slide_index, frames)
 
-            for j, run in enumerate(paragraph.runs, 1):
-                # Save run format and text
-                run_props = get_run_properties(run)
-                original_text = run.text
+def collect_text_frame(text_frame, slide_index: int, frames: list) -> None:
+    """Collect the runs of a text frame.
 
-                if original_text.strip():
-                    # Translate using ChatGPT
-                    translated_text = await translate_text(original_text, olang, tlang, ctx)
-                    runs_data.append((translated_text, run_props))
-                else:
-                    # Skip empty run text
-                    runs_data.append((original_text, run_props))
+    As in the XML engine, the run's position in its paragraph is kept as the run ``properties``.
+    Formatting is only snapshotted if a paragraph's runs have to be rebuilt when the
+    translation is written back, see apply_frame_translations.
+
+    Args:
+        text_frame: python-pptx TextFrame of a shape, table cell or chart title
+        slide_index (int): 1-based index of the slide containing the text frame
+        frames (list): List that collected text frame entries are appended to
+    """
+    if not text_frame.text.strip():
+        return
+
+    paragraphs = []
+    for paragraph in text_frame.paragraphs:
+        runs = []
+        for run_index, run in enumerate(paragraph.runs):
+            runs.append({
+                'text': run.text,
+                'properties': run_index,
+                'translation': None,
+            })
+        paragraphs.append({
+            'paragraph': paragraph,
+            'runs': runs,
+        })
+
+    frames.append({
+        'slide': slide_index,
+        'text_frame': text_frame,
+        'paragraphs': paragraphs,
+    })
+
+def collect_xml_paragraphs(root) -> list:
+    """Return paragraph entries for the ``a:p`` paragraphs with runs in a parsed XML part.
+
+    The run's position in its paragraph is kept as the run ``properties``, so paragraph mode
+    can reorder the ``a:r`` elements when the translation is written back.
+    """
+    return [
+        {'runs': [
+            {'text': run.findtext(A_T) or '', 'properties': run_index, 'translation': None}
+            for run_index, run in enumerate(paragraph.iterchildren(A_R))
+        ]}
+        for paragraph in root.iter(A_P)
+        if paragraph.find(A_R) is not None
+    ]
+
+def get_chart_label_elements(root) -> list:
+    """Return the ``c:v`` elements holding the string category labels and series names of a chart."""
+    labels = []
+    for element in root.iter(C_CAT, C_TX):
+        for cache in element.iter(C_STR_CACHE, C_STR_LIT, C_MULTI_LVL_STR_CACHE):
+            for point in cache.iter(C_PT):
+                value = point.find(C_V)
+                if value is not None:
+                    labels.append(value)
+    return labels
+
+def build_chart_label_frame(labels: list, slide_index: int):
+    """Return a frame entry with one single-run paragraph per chart label text, or None if all are empty."""
+    if not any(label.strip() for label in labels):
+        return None
+    return {
+        'slide': slide_index,
+        'chart_labels': True,
+        'paragraphs': [
+            {'runs': [{'text': label, 'properties': None, 'translation': None}]}
+            for label in labels
+        ],
+    }
+
+def collect_chart_text(chart, slide_index: int, frames: list) -> None:
+    """Collect the title, axis titles, category labels and series names of a chart.
+
+    Args:
+        chart: python-pptx Chart object
+        slide_index (int): 1-based index of the slide containing the chart
+        frames (list): List that collected text frame entries are appended to
+    """
+    # Auto-generated titles have no text frame, and asking for one would replace them
+    if chart.has_title and chart.chart_title.has_text_frame:
+        collect_text_frame(chart.chart_title.text_frame, slide_index, frames)
+    for axis_name in ('category_axis', 'value_axis'):
+        try:
+            axis = getattr(chart, axis_name)
+        except ValueError:
+            # Pie and doughnut charts have no axes
+            continue
+        if axis.has_title and axis.axis_title.has_text_frame:
+            collect_text_frame(axis.axis_title.text_frame, slide_index, frames)
+
+    # The labels are cached values in the chart XML rather than formatted runs
+    labels = [label.text or '' for label in get_chart_label_elements(chart._chartSpace)]
+    label_frame = build_chart_label_frame(labels, slide_index)
+    if label_frame:
+        label_frame['root'] = chart._chartSpace
+        frames.append(label_frame)
+
+def collect_diagram_text(slide_part, slide_index: int, frames: list) -> None:
+    """Collect the text of the SmartArt diagrams of a slide.
+
+    python-pptx has no SmartArt object model, so the diagram data and drawing parts related
+    to the slide are parsed directly. The drawing part is the rendering PowerPoint displays
+    and the data part the source it is regenerated from; both are translated.
+
+    Args:
+        slide_part: python-pptx SlidePart of the slide
+        slide_index (int): 1-based index of the slide
+        frames (list): List that collected text frame entries are appended to
+    """
+    for rel in slide_part.rels.values():
+        if rel.is_external or not rel.reltype.endswith(('/diagramData', '/diagramDrawing')):
+            continue
+        package_part = rel.target_part
+        blob = package_part.blob
+        paragraphs = collect_xml_paragraphs(etree.fromstring(blob, etree.XMLParser(resolve_entities=False)))
+        if any(run_entry['text'].strip() for paragraph_entry in paragraphs for run_entry in paragraph_entry['runs']):
+            frames.append({
+                'slide': slide_index,
+                'package_part': package_part,
+                'blob': blob,
+                'paragraphs': paragraphs,
+            })
+
+def collect_presentation_text(presentation) -> list:
+    """Collect the text frames of every slide in document order.
+
+    Besides text frames, table cells, chart titles and labels, SmartArt text and speaker
+    notes are collected with their slide, so they are batched with the rest of the deck.
+
+    With TRANSLATE_MASTERS, the text of the slide masters and their layouts is collected
+    first, once per deck, under slide index 0. Slides only hold the text they override, so
+    text shared through a layout or master is translated once for every slide using it.
+
+    Args:
+        presentation: python-pptx Presentation object
+
+    Returns:
+        list: Text frame entries as produced by collect_shape_text
+    """
+    frames = []
+    if TRANSLATE_MASTERS:
+        for slide_master in presentation.slide_masters:
+            for shape in slide_master.shapes:
+                collect_shape_text(shape, 0, frames)
+            for slide_layout in slide_master.slide_layouts:
+                for shape in slide_layout.shapes:
+                    collect_shape_text(shape, 0, frames)
+    for slide_index, slide in enumerate(presentation.slides, 1):
+        for shape in slide.shapes:
+            collect_shape_text(shape, slide_index, frames)
+        collect_diagram_text(slide.part, slide_index, frames)
+        if slide.has_notes_slide:
+            for shape in slide.notes_slide.shapes:
+                collect_shape_text(shape, slide_index, frames)
+    return frames
+
+def get_work_items(frames: list) -> list:
+    """Return the run entries that need translation, in document order."""
+    return [
+        run_entry
+        for frame in frames
+        for paragraph_entry in frame['paragraphs']
+        for run_entry in paragraph_entry['runs']
+        if run_entry['text'].strip()
+    ]
+
+# Patterns for runs that are passed through without calling the LLM
+NUMBER_PATTERN = re.compile(r'^[\d\s.,:;/%+\-–—()×x$€£¥₩#°*]*\d[\d\s.,:;/%+\-–—()×x$€£¥₩#°*]*$')
+DATE_PATTERN = re.compile(r'^\d{1,4}\s*[年/.\-]\s*\d{1,2}\s*[月/.\-]\s*\d{1,4}\s*日?$')
+URL_PATTERN = re.compile(r'^(https?://|www\.)\S+$|^[\w\-]+(\.[\w\-]+)*\.(com|org|net|edu|gov|io|ai|co|tw|jp|cn|uk|de)(/\S*)?$',
+                         re.IGNORECASE)
+EMAIL_PATTERN = re.compile(r'^[\w.+\-]+@[\w\-]+(\.[\w\-]+)+$')
+CODE_PATTERN = re.compile(r'^[A-Za-z_]\w*(\.[A-Za-z_]\w+)*(\(\))?$')
+CAMEL_CASE_PATTERN = re.compile(r'[a-z][A-Z]')
+
+# Writing system of each language, by lower-case code or English name
+LANGUAGE_SCRIPTS = {
+    'zh': 'han', 'zh-tw': 'han', 'zh-cn': 'han', 'zh-hk': 'han', 'chinese': 'han',
+    'traditional chinese': 'han', 'simplified chinese': 'han', '中文': 'han', '繁體中文': 'han', '简体中文': 'han',
+    'ja': 'japanese', 'japanese': 'japanese', '日本語': 'japanese',
+    'ko': 'hangul', 'korean': 'hangul', '한국어': 'hangul',
+    'ru': 'cyrillic', 'russian': 'cyrillic', 'uk': 'cyrillic', 'ukrainian': 'cyrillic', 'bg': 'cyrillic',
+    'bulgarian': 'cyrillic',
+    'el': 'greek', 'greek': 'greek',
+    'ar': 'arabic', 'arabic': 'arabic',
+    'he': 'hebrew', 'hebrew': 'hebrew',
+    'th': 'thai', 'thai': 'thai',
+    'hi': 'devanagari', 'hindi': 'devanagari',
+    'en': 'latin', 'english': 'latin', 'fr': 'latin', 'french': 'latin', 'de': 'latin', 'german': 'latin',
+    'es': 'latin', 'spanish': 'latin', 'it': 'latin', 'italian': 'latin', 'pt': 'latin', 'portuguese': 'latin',
+    'nl': 'latin', 'dutch': 'latin', 'vi': 'latin', 'vietnamese': 'latin', 'id': 'latin', 'indonesian': 'latin',
+}
+
+# Scripts written by a single language, so text in them can be taken for that language. Latin, Cyrillic,
+# Arabic and Devanagari serve many languages, and Han text may also be Japanese written only in kanji
+DISTINCTIVE_SCRIPTS = {'hangul', 'thai', 'greek', 'hebrew', 'japanese'}
+
+def get_language_script(lang: str):
+    """Return the writing system of a language code or name, or None if it is unknown."""
+    lang = lang.strip().lower()
+    return LANGUAGE_SCRIPTS.get(lang) or LANGUAGE_SCRIPTS.get(lang.split('-')[0])
+
+def get_char_script(char: str):
+    """Return the writing system of a letter."""
+    code = ord(char)
+    if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF or 0xF900 <= code <= 0xFAFF:
+        return 'han'
+    if 0x3040 <= code <= 0x30FF:
+        return 'kana'
+    if 0xAC00 <= code <= 0xD7AF or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+        return 'hangul'
+    if 0x0400 <= code <= 0x04FF:
+        return 'cyrillic'
+    if 0x0370 <= code <= 0x03FF:
+        return 'greek'
+    if 0x0600 <= code <= 0x06FF:
+        return 'arabic'
+    if 0x0590 <= code <= 0x05FF:
+        return 'hebrew'
+    if 0x0E00 <= code <= 0x0E7F:
+        return 'thai'
+    if 0x0900 <= code <= 0x097F:
+        return 'devanagari'
+    if code < 0x0250:
+        return 'latin'
+    return 'other'
+
+def detect_text_script(text: str):
+    """Return the single writing system used by the letters of a text, or None if mixed or absent."""
+    scripts = {get_char_script(char) for char in text if char.isalpha()}
+    if not scripts:
+        return None
+    if scripts == {'kana'} or scripts == {'kana', 'han'}:
+        return 'japanese'
+    if len(scripts) == 1:
+        return scripts.pop()
+    return None
+
+def classify_untranslatable(text: str, olang: str, tlang: str):
+    """Classify a run that does not need the LLM.
+
+    Args:
+        text (str): Run text with surrounding whitespace removed
+        olang (str): Original language code
+        tlang (str): Target language code
+
+    Returns:
+        str | None: The skip category ('number', 'date', 'url', 'email', 'symbol', 'code' or
+            'target_language'), or None if the text should be translated
+    """
+    if DATE_PATTERN.match(text):
+        return 'date'
+    if NUMBER_PATTERN.match(text):
+        return 'number'
+    if EMAIL_PATTERN.match(text):
+        return 'email'
+    if URL_PATTERN.match(text):
+        return 'url'
+    # Punctuation, emoji and other symbols without any letter or digit
+    if not any(char.isalnum() for char in text):
+        return 'symbol'
+    if CODE_PATTERN.match(text) and ('_' in text or '.' in text or text.endswith('()')
+                                     or CAMEL_CASE_PATTERN.search(text)):
+        return 'code'
+
+    # Text already in the target language: written in the target's script when the source uses another
+    # one, and that script is distinctive of the target, or is Latin text in a deck translated to English
+    source_script = get_language_script(olang)
+    target_script = get_language_script(tlang)
+    if source_script and target_script and source_script != target_script:
+        target_is_english = tlang.strip().lower().split('-')[0] in ('en', 'english')
+        if (detect_text_script(text) == target_script
+                and (target_script in DISTINCTIVE_SCRIPTS or target_is_english)):
+            return 'target_language'
+
+    return None
+
+def build_text_index(work_items: list) -> dict:
+    """Group work items by their text with surrounding whitespace removed.
+
+    Returns:
+        dict: Unique texts, in order of first appearance, mapped to the work items using them
+    """
+    text_index = {}
+    for item in work_items:
+        text_index.setdefault(item['text'].strip(), []).append(item)
+    return text_index
+
+def restore_whitespace(original: str, translated: str) -> str:
+    """Re-attach the leading and trailing whitespace of the original run to its translation."""
+    stripped = original.strip()
+    if not stripped:
+        return original
+    start = original.index(stripped)
+    return original[:start] + translated.strip() + original[start + len(stripped):]
+
+# Inline span markers used to translate a whole paragraph in one call
+SPAN_PATTERN = re.compile(r'<s(\d+)>(.*?)</s\1>', re.DOTALL)
+MARKER_PATTERN = re.compile(r'</?s\d+>')
+
+def serialize_paragraph(paragraph_entry: dict) -> str:
+    """Serialize the runs of a paragraph as ``<s1>text</s1><s2>text</s2>...``."""
+    return ''.join(
+        f"<s{index}>{run_entry['text']}</s{index}>"
+        for index, run_entry in enumerate(paragraph_entry['runs'], 1)
+    )
 
-            # Clear original content
-            for _ in range(len(paragraph.runs)):
-                paragraph._p.remove(paragraph.runs[0]._r)
+def split_marked_paragraph(translated: str, run_count: int):
+    """Split a translated marked paragraph back into runs.
 
-            # Add translated text and apply format
-            for text, props in runs_data:
-                run = paragraph.add_run()
+    Spans may come back in a different order when the target language reorders the
+    sentence; whitespace between spans is kept with the preceding span.
+
+    Args:
+        translated (str): Translation of a serialized paragraph
+        run_count (int): Number of runs that were serialized
+
+    Returns:
+        list | None: (run index, text) pairs in the returned order, or None if the markers are malformed
+    """
+    spans = []
+    position = 0
+    for match in SPAN_PATTERN.finditer(translated):
+        gap = translated[position:match.start()]
+        if gap.strip():
+            return None
+        text = match.group(2)
+        if spans:
+            spans[-1][1] += gap
+        else:
+            text = gap + text
+        spans.append([int(match.group(1)) - 1, text])
+        position = match.end()
+
+    tail = translated[position:]
+    if tail.strip() or not spans:
+        return None
+    spans[-1][1] += tail
+
+    if sorted(index for index, _ in spans) != list(range(run_count)):
+        return None
+    if any(MARKER_PATTERN.search(text) for _, text in spans):
+        return None
+    return [(index, text) for index, text in spans]
+
+def build_work_units(frames: list, paragraph_mode: bool = False) -> list:
+    """Return the units of text to translate, in document order.
+
+    In run mode every non-empty run is a unit. In paragraph mode, paragraphs with several
+    non-empty runs become a single unit carrying their runs serialized with span markers.
+    """
+    if not paragraph_mode:
+        return get_work_items(frames)
+
+    units = []
+    for frame in frames:
+        for paragraph_entry in frame['paragraphs']:
+            runs = [run_entry for run_entry in paragraph_entry['runs'] if run_entry['text'].strip()]
+            has_markers = any(MARKER_PATTERN.search(run_entry['text']) for run_entry in paragraph_entry['runs'])
+            if len(runs) < 2 or has_markers:
+                units.extend(runs)
+                continue
+            units.append({
+                'text': serialize_paragraph(paragraph_entry),
+                'plain_text': ''.join(run_entry['text'] for run_entry in paragraph_entry['runs']),
+                'paragraph': paragraph_entry,
+                'translation': None,
+            })
+    return units
+
+def get_slide_fingerprint(frames: list, paragraph_mode: bool = False) -> str:
+    """Fingerprint the source text structure of one slide.
+
+    The fingerprint covers the text of every run together with its frame and paragraph
+    boundaries, so any edit to the slide's text or run layout changes it.
+
+    Args:
+        frames (list): Collected text frame entries of the slide
+        paragraph_mode (bool): Whether the slide is translated in paragraph mode
+
+    Returns:
+        str: Hex digest identifying the slide's source text
+    """
+    structure = [
+        [[run_entry['text'] for run_entry in paragraph_entry['runs']] for paragraph_entry in frame['paragraphs']]
+        for frame in frames
+    ]
+    raw = json.dumps({'frames': structure, 'paragraph_mode': paragraph_mode}, ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def build_slide_work_units(frames: list, paragraph_mode: bool = False):
+    """Return the work units of a deck together with the range of units of each slide.
+
+    Returns:
+        tuple: (units, slides) where units are as produced by build_work_units and slides is
+            a list of (fingerprint, start, end) tuples indexing into the units
+    """
+    units = []
+    slides = []
+    for _, slide_frames in itertools.groupby(frames, key=lambda frame: frame['slide']):
+        slide_frames = list(slide_frames)
+        slide_units = build_work_units(slide_frames, paragraph_mode)
+        fingerprint = get_slide_fingerprint(slide_frames, paragraph_mode)
+        slides.append((fingerprint, len(units), len(units) + len(slide_units)))
+        units.extend(slide_units)
+    return units, slides
+
+def apply_paragraph_translation(unit: dict) -> bool:
+    """Split a translated paragraph unit back onto its runs.
+
+    Returns:
+        bool: False if the markers came back malformed and the paragraph needs run mode
+    """
+    paragraph_entry = unit['paragraph']
+    spans = split_marked_paragraph(unit['translation'], len(paragraph_entry['runs']))
+    if spans is None:
+        return False
+    paragraph_entry['rebuilt_runs'] = [
+        (text, paragraph_entry['runs'][index]['properties'])
+        for index, text in spans
+    ]
+    return True
+
+def apply_chart_label_translations(root, paragraphs: list) -> None:
+    """Write translated chart labels into the ``c:v`` elements of a chart."""
+    for label, paragraph_entry in zip(get_chart_label_elements(root), paragraphs):
+        run_entry = paragraph_entry['runs'][0]
+        label.text = run_entry['text'] if run_entry['translation'] is None else run_entry['translation']
+
+def apply_frame_translations(frame: dict) -> None:
+    """Write the translations of a collected text frame back into its runs.
+
+    When a paragraph keeps its runs in their original order, the text of each run is replaced
+    in place and its formatting is never touched. Only paragraphs whose runs were reordered
+    in paragraph mode are rebuilt: their run, paragraph and text frame formatting is
+    snapshotted before the first rebuild and re-applied to the new runs.
+
+    Args:
+        frame (dict): Text frame entry as produced by collect_shape_text
+    """
+    if frame.get('chart_labels'):
+        apply_chart_label_translations(frame['root'], frame['paragraphs'])
+        return
+    if 'package_part' in frame:
+        # Parse the original SmartArt part again, so every target language starts from the source
+        root = etree.fromstring(frame['blob'], etree.XMLParser(resolve_entities=False))
+        apply_xml_part_translations(root, frame['paragraphs'])
+        frame['package_part'].blob = etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+        return
+
+    for paragraph_entry in frame['paragraphs']:
+        paragraph = paragraph_entry['paragraph']
+        if 'rebuilt_runs' in paragraph_entry:
+            # Paragraph mode may return the runs in a different order
+            new_runs = paragraph_entry['rebuilt_runs']
+        else:
+            new_runs = [
+                (run_entry['text'] if run_entry['translation'] is None else run_entry['translation'],
+                 run_entry['properties'])
+                for run_entry in paragraph_entry['runs']
+            ]
+
+        runs = paragraph.runs
+        run_order = [run_index for _, run_index in new_runs]
+        if 'snapshot' not in paragraph_entry and run_order == list(range(len(runs))):
+            # Fast path: the run layout is unchanged, replace the text of each run in place
+            for run, (text, _) in zip(runs, new_runs):
                 run.text = text
-                apply_run_properties(run, props)
+            continue
+
+        # Snapshot the original formatting before the runs of this paragraph are first rebuilt
+        if 'snapshot' not in paragraph_entry:
+            paragraph_entry['snapshot'] = {
+                'runs': [get_run_properties(run) for run in runs],
+                'paragraph': get_paragraph_properties(paragraph),
+            }
+        if 'snapshot' not in frame:
+            frame['snapshot'] = get_text_frame_properties(frame['text_frame'])
+        snapshot = paragraph_entry['snapshot']
+
+        # Clear original content
+        for run in runs:
+            paragraph._p.remove(run._r)
+
+        # Add translated text and apply format
+        for text, run_index in new_runs:
+            run = paragraph.add_run()
+            run.text = text
+            apply_run_properties(run, snapshot['runs'][run_index])
+
+        # Restore paragraph format
+        apply_paragraph_properties(paragraph, snapshot['paragraph'])
+
+    # Restore text frame format
+    if 'snapshot' in frame:
+        apply_text_frame_properties(frame['text_frame'], frame['snapshot'])
+
+def load_presentation_text(file_path: str):
+    """Load a presentation and snapshot its text and formatting (runs in the worker executor).
+
+    Returns:
+        tuple: (presentation, frames) where frames are as produced by collect_presentation_text
+    """
+    presentation = Presentation(file_path)
+    return presentation, collect_presentation_text(presentation)
+
+def apply_and_save_presentation(presentation, frames: list, output_path: str) -> None:
+    """Write translations back into the presentation and save it (runs in the worker executor)."""
+    for frame in frames:
+        apply_frame_translations(frame)
+    presentation.save(output_path)
+
+def select_engine(file_path: str) -> str:
+    """Return the engine used for a deck: 'pptx' (python-pptx) or 'xml' (streaming XML)."""
+    if PPT_ENGINE == 'xml' or (PPT_ENGINE == 'auto' and os.path.getsize(file_path) >= XML_ENGINE_MIN_BYTES):
+        if zipfile.is_zipfile(file_path):
+            return 'xml'
+    return 'pptx'
+
+def get_part_relationships(archive, part_name: str) -> dict:
+    """Return the internal relationships of a package part as {id: (type, target part name)}."""
+    rels_name = posixpath.join(posixpath.dirname(part_name), '_rels', posixpath.basename(part_name) + '.rels')
+    if rels_name not in archive.NameToInfo:
+        return {}
+
+    relationships = {}
+    with archive.open(rels_name) as stream:
+        for _, rel in etree.iterparse(stream, events=('end',), tag=REL_TAG, resolve_entities=False):
+            if rel.get('TargetMode') != 'External':
+                target = rel.get('Target', '')
+                if target.startswith('/'):
+                    target = target[1:]
+                else:
+                    target = posixpath.normpath(posixpath.join(posixpath.dirname(part_name), target))
+                relationships[rel.get('Id')] = (rel.get('Type', ''), target)
+            rel.clear()
+    return relationships
 
-            # Restore paragraph format
-            apply_paragraph_properties(paragraph, para_props)
+# Relationship types of the parts whose text is translated along with their slide
+SLIDE_TEXT_PART_TYPES = ('/chart', '/notesSlide', '/diagramData', '/diagramDrawing')
 
-        # Restore text frame format
-        apply_text_frame_properties(text_frame, text_frame_props)
+def get_slide_text_parts(archive):
+    """Return the text-bearing XML parts of the deck.
 
-    except Exception as e:
-        print(f"[Error] Error translating shape: {str(e)}")
+    Returns:
+        tuple: (shared parts, slides) where shared parts are the slide master and layout parts
+            (empty unless TRANSLATE_MASTERS is set) and slides holds one list per slide, in
+            presentation order, with the slide part followed by its chart, SmartArt and notes parts
+    """
+    presentation_part = next(
+        (target for rel_type, target in get_part_relationships(archive, '').values()
+         if rel_type.endswith('/officeDocument')),
+        'ppt/presentation.xml'
+    )
+    presentation_rels = get_part_relationships(archive, presentation_part)
+    with archive.open(presentation_part) as stream:
+        slide_rel_ids = [
+            slide_id.get(R_ID)
+            for _, slide_id in etree.iterparse(stream, events=('end',), tag=P_SLD_ID, resolve_entities=False)
+        ]
+
+    shared_parts = []
+    if TRANSLATE_MASTERS:
+        for rel_type, master_part in presentation_rels.values():
+            if not rel_type.endswith('/slideMaster') or master_part not in archive.NameToInfo:
+                continue
+            shared_parts.append(master_part)
+            for layout_type, layout_part in get_part_relationships(archive, master_part).values():
+                if layout_type.endswith('/slideLayout') and layout_part in archive.NameToInfo:
+                    shared_parts.append(layout_part)
+
+    slides = []
+    seen = set(shared_parts)
+    for rel_id in slide_rel_ids:
+        slide_part = presentation_rels[rel_id][1]
+        parts = [slide_part]
+        for rel_type, target in get_part_relationships(archive, slide_part).values():
+            if rel_type.endswith(SLIDE_TEXT_PART_TYPES) and target in archive.NameToInfo and target not in seen:
+                parts.append(target)
+        seen.update(parts)
+        slides.append(parts)
+    return shared_parts, slides
+
+def load_xml_text(file_path: str):
+    """Collect the runs of a deck by streaming its slide, chart, SmartArt and notes XML (in the worker executor).
+
+    Each part is parsed incrementally and every paragraph is discarded once its run texts
+    are read, so memory stays proportional to the text rather than the deck. Chart category
+    labels and series names get a frame of their own, as in collect_chart_text. The collected
+    entries have the same shape as collect_shape_text's, with one frame per part and the
+    run's position in its paragraph as the run ``properties``. Slide master and layout parts
+    are collected first under slide index 0, as in collect_presentation_text.
+
+    Returns:
+        tuple: (frames, slide count)
+    """
+    frames = []
+    with zipfile.ZipFile(file_path) as archive:
+        shared_parts, slides = get_slide_text_parts(archive)
+        for slide_index, parts in [(0, shared_parts)] + list(enumerate(slides, 1)):
+            for part_name in parts:
+                paragraphs = []
+                labels = []
+                with archive.open(part_name) as stream:
+                    for _, element in etree.iterparse(stream, events=('end',), tag=(A_P, C_CAT, C_TX),
+                                                      resolve_entities=False):
+                        if element.tag == A_P:
+                            runs = [
+                                {'text': run.findtext(A_T) or '', 'properties': run_index, 'translation': None}
+                                for run_index, run in enumerate(element.iterchildren(A_R))
+                            ]
+                            if runs:
+                                paragraphs.append({'runs': runs})
+                        else:
+                            labels.extend(label.text or '' for label in get_chart_label_elements(element))
+                        element.clear()
+                if paragraphs:
+                    frames.append({'slide': slide_index, 'part': part_name, 'paragraphs': paragraphs})
+                label_frame = build_chart_label_frame(labels, slide_index)
+                if label_frame:
+                    label_frame['part'] = part_name
+                    frames.append(label_frame)
+    return frames, len(slides)
+
+def apply_xml_part_translations(root, paragraphs: list) -> None:
+    """Write translated run texts into the ``a:t`` nodes of a parsed part."""
+    paragraph_elements = (paragraph for paragraph in root.iter(A_P) if paragraph.find(A_R) is not None)
+    for paragraph, paragraph_entry in zip(paragraph_elements, paragraphs):
+        runs = list(paragraph.iterchildren(A_R))
+        if 'rebuilt_runs' in paragraph_entry:
+            # Paragraph mode may return the runs in a different order
+            for run, (text, run_index) in zip(runs, paragraph_entry['rebuilt_runs']):
+                new_run = copy.deepcopy(runs[run_index])
+                new_run.find(A_T).text = text
+                paragraph.replace(run, new_run)
+            continue
+        for run, run_entry in zip(runs, paragraph_entry['runs']):
+            if run_entry['translation'] is not None:
+                run.find(A_T).text = run_entry['translation']
+
+def copy_zip_entry(source, target, info) -> None:
+    """Copy a zip entry into another zip file as raw compressed bytes, without decompressing it."""
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    source.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+
+    entry = copy.copy(info)
+    # Write the CRC and sizes in the local header instead of a trailing data descriptor
+    entry.flag_bits &= ~0x08
+    entry.header_offset = target.fp.tell()
+    target.fp.write(entry.FileHeader())
+    remaining = info.compress_size
+    while remaining:
+        chunk = source.fp.read(min(FILE_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated zip entry: {info.filename}")
+        target.fp.write(chunk)
+        remaining -= len(chunk)
+
+    target.filelist.append(entry)
+    target.NameToInfo[entry.filename] = entry
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+def save_xml_translations(file_path: str, frames: list, output_path: str) -> None:
+    """Write a translated copy of a deck, rewriting only the text parts (runs in the worker executor).
+
+    Slide, chart and notes parts with collected runs are parsed one at a time, their ``a:t``
+    nodes rewritten and the part written back deflate-compressed; every other part, media
+    included, is copied as raw compressed bytes. Peak memory is bounded by the largest rewritten XML part.
+    """
+    part_frames = {}
+    for frame in frames:
+        part_frames.setdefault(frame['part'], []).append(frame)
+    parser = etree.XMLParser(resolve_entities=False)
+    with zipfile.ZipFile(file_path) as source, zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            if info.filename not in part_frames:
+                copy_zip_entry(source, target, info)
+                continue
+            with source.open(info) as stream:
+                tree = etree.parse(stream, parser)
+            for frame in part_frames[info.filename]:
+                if frame.get('chart_labels'):
+                    apply_chart_label_translations(tree.getroot(), frame['paragraphs'])
+                else:
+                    apply_xml_part_translations(tree.getroot(), frame['paragraphs'])
+            data = etree.tostring(tree, xml_declaration=True, encoding='UTF-8', standalone=True)
+            target.writestr(zipfile.ZipInfo(info.filename, date_time=info.date_time), data,
+                            compress_type=zipfile.ZIP_DEFLATED)
+
+def save_translated_deck(engine: str, file_path: str, presentation, frames: list, output_path: str) -> None:
+    """Write the translations into a copy of the deck and move it into place (runs in the worker executor).
+
+    The deck is saved to a temporary file first, so a reader of ``output_path`` never sees a
+    half-written preview or final file.
+    """
+    temp_path = output_path + '.part'
+    try:
+        if engine == 'xml':
+            save_xml_translations(file_path, frames, temp_path)
+        else:
+            apply_and_save_presentation(presentation, frames, temp_path)
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+async def run_blocking(func, *args):
+    """Run a blocking python-pptx or database function in the worker executor, keeping the event loop free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pptx_executor, func, *args)
+
+async def load_deck_text(file_path: str):
+    """Load a deck with the engine selected for it and collect its text off the event loop.
+
+    Returns:
+        tuple: (engine, presentation, frames, slide count); presentation is None for the xml engine
+    """
+    engine = select_engine(file_path)
+    if engine == 'xml':
+        # Very large decks are streamed part by part instead of loading the whole object model
+        presentation = None
+        frames, total_slides = await run_blocking(load_xml_text, file_path)
+    else:
+        presentation, frames = await run_blocking(load_presentation_text, file_path)
+        total_slides = len(presentation.slides)
+    print(f"[Info] Loaded {total_slides} slide(s) with the {engine} engine")
+    return engine, presentation, frames, total_slides
+
+async def monitor_loop_lag(stats: dict, interval: float = LOOP_LAG_INTERVAL) -> None:
+    """Sample how late the event loop wakes up from a sleep, until cancelled.
+
+    Args:
+        stats (dict): Dict updated in place with ``samples``, ``total`` and ``max`` lag in seconds
+        interval (float): Sampling interval in seconds
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        stats['samples'] += 1
+        stats['total'] += lag
+        stats['max'] = max(stats['max'], lag)
+
+async def translate_work_items(work_items: list, olang: str, tlang: str, ctx=None, use_cache: bool = True,
+                               progress_callback=None, journal=None, failed: set = None, mode: str = 'final',
+                               backend: str = None) -> dict:
+    """Translate work items in place, setting the ``translation`` of each one.
+
+    Identical texts are translated once and fanned out, and texts that need no translation
+    (numbers, dates, URLs, symbols, code, text already in the target language) are passed
+    through without calling the LLM.
+
+    Args:
+        work_items (list): Run entries or paragraph units with a ``text`` to translate, and
+            optionally the ``slide`` they belong to
+        olang (str): Original language code
+        tlang (str): Target language code
+        ctx: MCP context object
+        use_cache (bool): Whether to consult and update the translation memory
+        progress_callback: Optional async callable receiving (completed, total) text counts
+        journal (TranslationJournal): Optional journal of completed translations to resume from
+        failed (set): Optional set that texts whose translation failed are added to
+        mode (str): Translation mode, 'final' or 'draft'
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+
+    Returns:
+        dict: Deduplication and skip statistics
+    """
+    # Deduplicate identical texts so each one is translated exactly once
+    text_index = build_text_index(work_items)
+    unique_texts = list(text_index)
+    dedup_ratio = len(unique_texts) / len(work_items) if work_items else 1.0
+    print(f"[Info] Collected {len(work_items)} text(s), {len(unique_texts)} unique (dedup ratio {dedup_ratio:.2f})")
+
+    # Pass numbers, dates, URLs, symbols, code and text already in the target language through
+    skipped = {}
+    texts_to_translate = []
+    for text in unique_texts:
+        first_item = text_index[text][0]
+        category = classify_untranslatable(first_item.get('plain_text', text).strip(), olang, tlang)
+        if category:
+            skipped[category] = skipped.get(category, 0) + 1
+            for item in text_index[text]:
+                item['translation'] = item['text']
+        else:
+            texts_to_translate.append(text)
+    skipped_count = len(unique_texts) - len(texts_to_translate)
+    print(f"[Info] Skipped {skipped_count} untranslatable text(s): {skipped}")
+    if ctx:
+        await ctx.info(f"Translating {len(texts_to_translate)} unique text(s)...")
+        await ctx.report_progress(0, len(texts_to_translate))
+    if progress_callback:
+        await progress_callback(0, len(texts_to_translate))
+
+    async def report_progress(completed, total):
+        print(f"[Progress] Translated {completed}/{total} unique text(s)")
         if ctx:
-            await ctx.info(f"Error translating shape: {str(e)}")
-        raise
+            await ctx.report_progress(completed, total)
+        if progress_callback:
+            await progress_callback(completed, total)
+
+    # Translate concurrently, keeping the texts of a slide in one batch where possible,
+    # then fan the results out to every item using the text
+    groups = None
+    if all('slide' in text_index[text][0] for text in texts_to_translate):
+        groups = [text_index[text][0]['slide'] for text in texts_to_translate]
+    batch_stats = {'batches': 0, 'batch_fill_avg': None, 'batch_fill_min': None}
+    translations = await translate_texts(
+        texts_to_translate, olang, tlang, ctx,
+        progress_callback=report_progress, use_cache=use_cache, journal=journal, failed=failed, mode=mode,
+        backend=backend, groups=groups, stats=batch_stats
+    )
+    for text, translated_text in zip(texts_to_translate, translations):
+        for item in text_index[text]:
+            item['translation'] = restore_whitespace(item['text'], translated_text)
+
+    return {
+        'unique_texts': len(unique_texts),
+        'dedup_ratio': round(dedup_ratio, 3),
+        'skipped_texts': skipped,
+        'llm_items_avoided': skipped_count,
+        **batch_stats,
+    }
 
-async def translate_ppt_file(file_path: str, olang: str, tlang: str, ctx=None) -> str:
-    """Translate a PowerPoint file.
+async def translate_units(units: list, olang: str, tlang: str, ctx=None, use_cache: bool = True,
+                          progress_callback=None, slides: list = None, journal=None, mode: str = 'final',
+                          backend: str = None) -> dict:
+    """Translate work units into one target language without modifying the units.
+
+    Keeping the results separate lets several target languages be translated concurrently
+    from a single extraction of the deck. When ``slides`` is given, slides whose fingerprint
+    was translated before are spliced in from the translation memory and only the changed
+    slides are translated.
 
     Args:
-        file_path (str): Path to the PowerPoint file
+        units (list): Work units as produced by build_work_units
         olang (str): Original language code
         tlang (str): Target language code
         ctx: MCP context object
+        use_cache (bool): Whether to consult and update the translation memory
+        progress_callback: Optional async callable receiving (completed, total) text counts
+        slides (list): Optional (fingerprint, start, end) ranges of the units of each slide
+        journal (TranslationJournal): Optional journal of completed translations to resume from
+        mode (str): Translation mode, 'final' or 'draft'
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
 
     Returns:
-        str: Path to the translated file
+        dict: ``translations`` aligned with the units, run-mode ``fallback`` translations of
+            paragraph units whose markers came back malformed, and translation ``stats``
+    """
+    cache_model = get_cache_model(mode, backend)
+    translations = [None] * len(units)
+    fallback = {}
+
+    # Splice in slides whose source text is unchanged since they were last translated
+    pending_slides = []
+    reused_slides = 0
+    stored_slides = [None] * len(slides or [])
+    if slides and use_cache:
+        # Look every slide up in one transaction, off the event loop
+        stored_slides = await run_blocking(translation_memory.get_slides,
+                                           [fingerprint for fingerprint, _, _ in slides], olang, tlang, cache_model)
+    for (fingerprint, start, end), stored in zip(slides or [], stored_slides):
+        if stored is None or len(stored['translations']) != end - start:
+            pending_slides.append((fingerprint, start, end))
+            continue
+        translations[start:end] = stored['translations']
+        for offset, run_translations in stored['fallback'].items():
+            fallback[start + int(offset)] = run_translations
+        reused_slides += 1
+    if slides is None:
+        pending = list(range(len(units)))
+    else:
+        pending = [index for _, start, end in pending_slides for index in range(start, end)]
+        print(f"[Info] Reused {reused_slides} unchanged slide(s) ({tlang}), "
+              f"translating {len(pending_slides)} slide(s)")
+
+    items = [
+        {'text': units[index]['text'], 'plain_text': units[index].get('plain_text', units[index]['text']),
+         'translation': None}
+        for index in pending
+    ]
+    if slides is not None:
+        unit_slides = {index: start for _, start, end in slides for index in range(start, end)}
+        for index, item in zip(pending, items):
+            item['slide'] = unit_slides[index]
+    failed = set()
+    stats = await translate_work_items(items, olang, tlang, ctx, use_cache, progress_callback, journal, failed, mode,
+                                       backend)
+    for index, item in zip(pending, items):
+        translations[index] = item['translation']
+
+    # Translate paragraphs whose markers came back malformed again in run mode
+    fallback_items = {}
+    for index in pending:
+        unit = units[index]
+        if 'paragraph' not in unit:
+            continue
+        if split_marked_paragraph(translations[index], len(unit['paragraph']['runs'])) is None:
+            fallback_items[index] = [
+                {'text': run_entry['text'], 'translation': None}
+                for run_entry in unit['paragraph']['runs']
+                if run_entry['text'].strip()
+            ]
+    if fallback_items and mode == 'draft':
+        # Drafts do not retranslate run by run, the whole paragraph goes on its first run instead
+        print(f"[Warning] Malformed markers in {len(fallback_items)} paragraph(s), "
+              f"keeping each paragraph on its first run")
+        for index, run_items in fallback_items.items():
+            text = MARKER_PATTERN.sub('', translations[index])
+            for position, item in enumerate(run_items):
+                item['translation'] = text if position == 0 else ''
+    elif fallback_items:
+        fallback_runs = [item for run_items in fallback_items.values() for item in run_items]
+        print(f"[Warning] Malformed markers in {len(fallback_items)} paragraph(s), "
+              f"translating {len(fallback_runs)} run(s) individually")
+        await translate_work_items(fallback_runs, olang, tlang, ctx, use_cache, progress_callback, journal, failed,
+                                   mode, backend)
+    for index, run_items in fallback_items.items():
+        fallback[index] = [item['translation'] for item in run_items]
+
+    # Remember the translated slides for the next revision of the deck
+    def has_failed_text(unit):
+        texts = [unit['text']]
+        if 'paragraph' in unit:
+            texts += [run_entry['text'] for run_entry in unit['paragraph']['runs']]
+        return any(text.strip() in failed for text in texts)
+
+    if use_cache and pending_slides:
+        stored_fingerprints = []
+        stored_slides = []
+        for fingerprint, start, end in pending_slides:
+            if any(has_failed_text(units[index]) for index in range(start, end)):
+                continue
+            stored_fingerprints.append(fingerprint)
+            stored_slides.append({
+                'translations': translations[start:end],
+                'fallback': {index - start: fallback[index] for index in range(start, end) if index in fallback},
+            })
+        await run_blocking(translation_memory.put_slides, stored_fingerprints, olang, tlang, cache_model,
+                           stored_slides)
+
+    stats['paragraph_units'] = sum(1 for index in pending if 'paragraph' in units[index])
+    stats['failed_texts'] = len(failed)
+    stats['paragraph_fallbacks'] = len(fallback_items)
+    if slides is not None:
+        stats['reused_slides'] = reused_slides
+        stats['translated_slides'] = len(pending_slides)
+    return {
+        'translations': translations,
+        'fallback': fallback,
+        'stats': stats,
+    }
+
+def apply_unit_translations(units: list, result: dict) -> None:
+    """Store the translations of one target language on the collected runs and paragraphs.
+
+    Args:
+        units (list): Work units as produced by build_work_units
+        result (dict): Result of translate_units for the target language
     """
+    for index, unit in enumerate(units):
+        if 'paragraph' not in unit:
+            unit['translation'] = result['translations'][index]
+            continue
+
+        paragraph_entry = unit['paragraph']
+        paragraph_entry.pop('rebuilt_runs', None)
+        if index in result['fallback']:
+            runs = [run_entry for run_entry in paragraph_entry['runs'] if run_entry['text'].strip()]
+            for run_entry, translated_text in zip(runs, result['fallback'][index]):
+                run_entry['translation'] = translated_text
+        else:
+            unit['translation'] = result['translations'][index]
+            apply_paragraph_translation(unit)
+
+def apply_preview_translations(units: list, olang: str, tlang: str, journal=None, use_cache: bool = True,
+                               mode: str = 'final', backend: str = None) -> int:
+    """Store the translations completed so far for one target language on the collected runs and paragraphs.
+
+    Completed translations are read from the journal and the translation memory; units that
+    are not translated yet, and paragraphs whose markers came back malformed, keep their source text.
+
+    Returns:
+        int: Number of units with a translation
+    """
+    cache_model = get_cache_model(mode, backend)
+    translated = 0
+    for unit in units:
+        text = unit['text'].strip()
+        translation = journal.get(text) if journal else None
+        if translation is None and use_cache:
+            translation = translation_memory.peek(text, olang, tlang, cache_model)
+
+        if 'paragraph' not in unit:
+            unit['translation'] = None if translation is None else restore_whitespace(unit['text'], translation)
+        else:
+            unit['paragraph'].pop('rebuilt_runs', None)
+            if translation is None:
+                continue
+            unit['translation'] = restore_whitespace(unit['text'], translation)
+            if not apply_paragraph_translation(unit):
+                continue
+        if translation is not None:
+            translated += 1
+    return translated
+
+def get_language_suffix(tlang: str) -> str:
+    """Turn a target language into a file name suffix."""
+    return re.sub(r'[^\w\-]+', '_', tlang.strip()).strip('_') or 'translated'
+
+async def translate_ppt_file_languages(file_path: str, olang: str, tlangs: list, ctx=None, use_cache: bool = True,
+                                       progress_callback=None, summaries: dict = None,
+                                       paragraph_mode: bool = False, journals: dict = None,
+                                       mode: str = 'final', preview_callback=None, backend: str = None) -> dict:
+    """Translate a PowerPoint file into one or more target languages.
+
+    The deck is parsed and its runs are collected once. The collected texts are then
+    translated into every target language concurrently, and each language is written back
+    and saved in turn. Decks selected by PPT_ENGINE are streamed through the XML engine
+    instead of python-pptx. With a single target language the output is named
+    ``translated_<name>``; with several, ``translated_<name>_<language>``. Every call writes
+    into its own directory under RESULT_PATH, so translations of the same uploaded file never
+    overwrite each other.
+
+    When ``preview_callback`` is given, a partially translated preview of every journaled
+    language is written every PREVIEW_INTERVAL seconds while the texts are being translated.
+    Previews and final files are both moved into place only once completely written.
+
+    Args:
+        file_path (str): Path to the PowerPoint file
+        olang (str): Original language code
+        tlangs (list): Target language codes
+        ctx: MCP context object
+        use_cache (bool): Whether to consult and update the translation memory
+        progress_callback: Optional async callable receiving (completed, total) text counts,
+            summed over all target languages
+        summaries (dict): Optional dict filled in with translation statistics per target language
+        paragraph_mode (bool): Translate multi-run paragraphs in one call with inline span markers
+        journals (dict): Optional TranslationJournal per target language; completed translations
+            are resumed from and appended to it, and it is removed once the language is saved
+        mode (str): Translation mode, 'final' or 'draft'
+        preview_callback: Optional async callable receiving a dict with the ``language``, ``file_name``,
+            ``path``, ``translated_units`` and ``total_units`` of each preview written
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+
+    Returns:
+        dict: Path of the translated file for each target language
+    """
+    journals = journals or {}
+    # Measure event loop responsiveness while this deck is processed
+    loop_lag = {'samples': 0, 'total': 0.0, 'max': 0.0}
+    lag_monitor = asyncio.create_task(monitor_loop_lag(loop_lag))
+    preview_done = asyncio.Event()
+    preview_task = None
+
     try:
         print("\n========== PowerPoint Translation Process ==========")
-        # 1. Create output directory
-        os.makedirs(OUTPUT_PATH, exist_ok=True)
+        # 1. Create a unique output directory for this call, dropping expired ones
+        await run_blocking(prune_result_files)
+        output_dir = os.path.join(RESULT_PATH, uuid.uuid4().hex)
+        os.makedirs(output_dir, exist_ok=True)
 
-        # 2. Prepare output file path
+        # 2. Prepare output file paths
         file_name = os.path.basename(file_path)
         name, ext = os.path.splitext(file_name)
-        output_file = f'translated_{name}{ext}'
-        output_path = os.path.join(OUTPUT_PATH, output_file)
+        output_paths = {}
+        for tlang in tlangs:
+            if len(tlangs) == 1:
+                output_file = f'translated_{name}{ext}'
+            else:
+                output_file = f'translated_{name}_{get_language_suffix(tlang)}{ext}'
+            output_paths[tlang] = os.path.join(output_dir, output_file)
 
         # 3. Load PowerPoint
         print(f"[Info] Starting PowerPoint translation...")
         print(f"[Info] Source language: {olang}")
-        print(f"[Info] Target language: {tlang}")
+        print(f"[Info] Target language(s): {', '.join(tlangs)}")
+        print(f"[Info] Translation mode: {mode} ({get_mode_model(mode)}), backend: {backend or TRANSLATION_BACKEND}")
         if ctx:
-            await ctx.info(f"Starting translation...\nFrom {olang} to {tlang}")
-
-        presentation = Presentation(file_path)
-        total_slides = len(presentation.slides)
-
-        # 4. Translate each slide
-        for index, slide in enumerate(presentation.slides, 1):
-            progress_msg = f"Translating slide {index}/{total_slides}..."
-            print(f"\n[Progress] {progress_msg}")
-
-            # Count shapes in the slide
-            shape_count = len(slide.shapes)
-
-            if ctx:
-                await ctx.info(progress_msg)
-                # Report progress (0-100%)
-                await ctx.report_progress(index - 1, total_slides)
+            await ctx.info(f"Starting translation...\nFrom {olang} to {', '.join(tlangs)}")
+
+        # 4. Load the presentation and collect all translatable runs off the event loop
+        engine, presentation, frames, total_slides = await load_deck_text(file_path)
+        shared_frames = sum(1 for frame in frames if frame['slide'] == 0)
+        if shared_frames:
+            print(f"[Info] Collected {shared_frames} text frame(s) from slide masters and layouts")
+
+        # 5. Translate the runs, or whole paragraphs with inline span markers in paragraph mode,
+        #    into every target language concurrently
+        units, slides = build_slide_work_units(frames, paragraph_mode)
+        language_progress = {}
+
+        def make_progress_callback(tlang):
+            async def report_language_progress(completed, total):
+                language_progress[tlang] = (completed, total)
+                if progress_callback:
+                    await progress_callback(sum(c for c, _ in language_progress.values()),
+                                            sum(t for _, t in language_progress.values()))
+            return report_language_progress
+
+        async def write_previews():
+            # Write a preview of each language that progressed since its last preview, until translation ends
+            previewed = {}
+            while True:
+                try:
+                    await asyncio.wait_for(preview_done.wait(), PREVIEW_INTERVAL)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+                for tlang in tlangs:
+                    completed, total = language_progress.get(tlang, (0, 0))
+                    if tlang not in journals or not completed or completed >= total:
+                        continue
+                    if previewed.get(tlang) == completed:
+                        continue
+                    previewed[tlang] = completed
+                    try:
+                        translated_units = await run_blocking(apply_preview_translations, units, olang, tlang,
+                                                              journals[tlang], use_cache, mode, backend)
+                        os.makedirs(PREVIEW_PATH, exist_ok=True)
+                        preview_path = os.path.join(PREVIEW_PATH, journals[tlang].key + ext)
+                        await run_blocking(save_translated_deck, engine, file_path, presentation, frames,
+                                           preview_path)
+                    except Exception as e:
+                        print(f"[Warning] Could not write preview ({tlang}): {str(e)}")
+                        continue
+                    print(f"[Info] Preview ({tlang}) with {translated_units}/{len(units)} translated unit(s) "
+                          f"saved to: {preview_path}")
+                    await preview_callback({
+                        'language': tlang,
+                        'file_name': 'preview_' + os.path.basename(output_paths[tlang]).removeprefix('translated_'),
+                        'path': preview_path,
+                        'translated_units': translated_units,
+                        'total_units': len(units),
+                    })
 
-            # Translate each shape in the slide
-            for shape_idx, shape in enumerate(slide.shapes, 1):
+        if preview_callback and PREVIEW_INTERVAL > 0 and journals:
+            preview_task = asyncio.create_task(write_previews())
 
-                await translate_shape(shape, olang, tlang, ctx)
+        results = await asyncio.gather(*(
+            translate_units(units, olang, tlang, ctx, use_cache, make_progress_callback(tlang), slides,
+                            journals.get(tlang), mode, backend)
+            for tlang in tlangs
+        ))
+        # Let a preview being written finish before the final files are applied to the same deck
+        preview_done.set()
+        if preview_task:
+            await preview_task
 
-        # 5. Save the translated file
+        # 6. Apply each language's translations and save its file off the event loop
         if ctx:
-            await ctx.info("Translation complete, generating file...")
-            await ctx.report_progress(total_slides, total_slides)  # 100% complete
-
-        presentation.save(output_path)
-        print(f"[Success] Translated file saved to: {output_path}")
+            await ctx.info("Translation complete, generating file(s)...")
+
+        run_count = len(get_work_items(frames))
+        for tlang, result in zip(tlangs, results):
+            apply_unit_translations(units, result)
+            await run_blocking(save_translated_deck, engine, file_path, presentation, frames, output_paths[tlang])
+            print(f"[Success] Translated file ({tlang}) saved to: {output_paths[tlang]}")
+            failed_count = result['stats']['failed_texts']
+            if failed_count:
+                # Keep the journal so resubmitting the deck only retries the failed texts
+                print(f"[Warning] {failed_count} text(s) could not be translated ({tlang}) and were "
+                      f"kept in the source language, resubmit the deck to retry them")
+            elif tlang in journals:
+                journals[tlang].remove()
+            if summaries is not None:
+                summaries[tlang] = dict(result['stats'], slides=total_slides, runs=run_count,
+                                        shared_frames=shared_frames, mode=mode)
+
+        if use_cache:
+            cache_stats = translation_memory.stats()
+            print(f"[Info] Translation memory: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es), "
+                  f"{cache_stats['entries']} cached entries")
+        connection_stats = get_connection_stats()
+        print(f"[Info] HTTP connections: {connection_stats['requests']} request(s), "
+              f"{connection_stats['connections']} new connection(s), {connection_stats['reused']} reused")
+        scheduler_stats = request_scheduler.stats
+        print(f"[Info] Rate limiter: {scheduler_stats['retries']} retries, "
+              f"{scheduler_stats['wait_time']:.1f}s waited, {scheduler_stats['dropped']} dropped item(s)")
+        if loop_lag['samples']:
+            print(f"[Info] Event loop lag: max {loop_lag['max'] * 1000:.1f}ms, "
+                  f"avg {loop_lag['total'] / loop_lag['samples'] * 1000:.1f}ms")
         print(f"========== PowerPoint Translation Complete ==========\n")
 
-        # 6. Return the path
-        return output_path
+        # 7. Return the paths
+        return output_paths
 
     except Exception as e:
         error_msg = f"Error during translation process: {str(e)}"
@@ -382,8 +2444,654 @@ async def translate_ppt_file(file_path: str, olang: str, tlang: str, ctx=None) -
             await ctx.info(error_msg)
         raise
 
+    finally:
+        lag_monitor.cancel()
+        preview_done.set()
+        if preview_task and not preview_task.done():
+            await asyncio.gather(preview_task, return_exceptions=True)
+        # Keep the journals of unfinished languages so a resubmitted deck can resume
+        for journal in journals.values():
+            journal.close()
+
+async def translate_ppt_file(file_path: str, olang: str, tlang: str, ctx=None, use_cache: bool = True,
+                             progress_callback=None, summary: dict = None, paragraph_mode: bool = False,
+                             mode: str = 'final', backend: str = None) -> str:
+    """Translate a PowerPoint file.
+
+    All translatable runs of the presentation are collected first and translated by
+    translate_work_items, then written back in document order. In paragraph mode, paragraphs
+    with several runs are translated in one call with inline span markers and fall back to
+    run mode when the markers come back malformed. Progress is reported in translated
+    unique texts. Loading, snapshotting and saving the presentation run in a worker thread
+    so other sessions are not stalled.
+
+    Args:
+        file_path (str): Path to the PowerPoint file
+        olang (str): Original language code
+        tlang (str): Target language code
+        ctx: MCP context object
+        use_cache (bool): Whether to consult and update the translation memory
+        progress_callback: Optional async callable receiving (completed, total) text counts
+        summary (dict): Optional dict filled in with statistics about the translation
+        paragraph_mode (bool): Translate multi-run paragraphs in one call with inline span markers
+        mode (str): Translation mode, 'final' or 'draft'
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+
+    Returns:
+        str: Path to the translated file
+    """
+    summaries = {}
+    output_paths = await translate_ppt_file_languages(
+        file_path, olang, [tlang], ctx, use_cache=use_cache, progress_callback=progress_callback,
+        summaries=summaries, paragraph_mode=paragraph_mode, mode=mode, backend=backend
+    )
+    if summary is not None:
+        summary.update(summaries[tlang])
+    return output_paths[tlang]
+
+def hash_file(file_path: str):
+    """Return a sha256 digest object of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(FILE_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest
+
+def get_document_cache_key(file_digest, olang: str, tlang: str, paragraph_mode: bool = False,
+                           mode: str = 'final', backend: str = None) -> str:
+    """Hash a deck together with the translation settings that affect its output.
+
+    Args:
+        file_digest: sha256 digest object of the deck returned by hash_file, left unchanged so one
+            digest serves every target language
+        olang (str): Original language code
+        tlang (str): Target language code
+        paragraph_mode (bool): Whether multi-run paragraphs are translated with inline span markers
+        mode (str): Translation mode, 'final' or 'draft'
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+
+    Returns:
+        str: Hex document cache key
+    """
+    digest = file_digest.copy()
+    for part in (olang.strip().lower(), tlang.strip().lower(), get_cache_model(mode, backend), PROMPT_VERSION,
+                 str(paragraph_mode)):
+        digest.update(b'\x1f' + part.encode('utf-8'))
+    return digest.hexdigest()
+
+def evict_document_cache() -> None:
+    """Drop cached documents older than the age limit, then the oldest ones over the size cap."""
+    if not os.path.isdir(DOC_CACHE_PATH):
+        return
+
+    now = time.time()
+    entries = []
+    for entry in os.scandir(DOC_CACHE_PATH):
+        if not entry.is_file():
+            continue
+        stat = entry.stat()
+        if now - stat.st_mtime > DOC_CACHE_MAX_AGE:
+            os.remove(entry.path)
+        else:
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= DOC_CACHE_MAX_BYTES:
+            break
+        os.remove(path)
+        total_size -= size
+
+def lookup_document_cache(key: str, ext: str, output_path: str):
+    """Copy a cached translated document to ``output_path``.
+
+    The result is served from the copy, so a later eviction of the cache entry never breaks
+    a download of it.
+
+    Returns:
+        str | None: ``output_path``, or None if the document is not cached
+    """
+    evict_document_cache()
+    cached_path = os.path.join(DOC_CACHE_PATH, key + ext)
+    try:
+        # Refresh the modification time so recently used documents are evicted last
+        os.utime(cached_path)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        shutil.copyfile(cached_path, output_path)
+    except FileNotFoundError:
+        return None
+    return output_path
+
+def store_document_cache(key: str, ext: str, output_path: str) -> None:
+    """Store a translated document in the content-addressed cache."""
+    try:
+        os.makedirs(DOC_CACHE_PATH, exist_ok=True)
+        cached_path = os.path.join(DOC_CACHE_PATH, key + ext)
+        temp_path = cached_path + '.tmp'
+        shutil.copyfile(output_path, temp_path)
+        os.replace(temp_path, cached_path)
+        evict_document_cache()
+    except Exception as e:
+        print(f"[Warning] Could not store translated document in cache: {str(e)}")
+
+class TranslationJournal:
+    """Append-only log of the texts of one deck and target language translated so far.
+
+    Every completed translation is appended as one JSON line as soon as it comes back, so a
+    deck interrupted by a crash or a provider outage resumes from the journal instead of
+    requesting the completed texts again. The journal is removed once the deck is saved.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.path = os.path.join(JOURNAL_PATH, key + '.jsonl')
+        self.entries = {}
+        self._file = None
+        if os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A line cut short by a crash, the rest of the journal is still valid
+                        continue
+                    self.entries[entry['text']] = entry['translation']
+
+    def get(self, text: str):
+        """Return the journaled translation of a text, or None."""
+        return self.entries.get(text)
+
+    def record(self, texts: list, translations: list, failed: set) -> None:
+        """Append completed translations to the journal and flush them to disk.
+
+        Texts in ``failed`` kept their source text because the call failed and are not journaled,
+        so they are requested again when the deck is resumed.
+        """
+        if self._file is None:
+            os.makedirs(JOURNAL_PATH, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        for text, translated_text in zip(texts, translations):
+            if text in failed:
+                continue
+            self.entries[text] = translated_text
+            self._file.write(json.dumps({'text': text, 'translation': translated_text}, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the journal file, keeping it on disk for a later resume."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the journal once its deck is complete."""
+        self.close()
+        self.entries = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def prune_result_files() -> None:
+    """Delete the output directories of translations older than the result retention period."""
+    if not os.path.isdir(RESULT_PATH):
+        return
+    now = time.time()
+    for entry in os.scandir(RESULT_PATH):
+        if entry.is_dir() and now - entry.stat().st_mtime > RESULT_RETENTION:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+def prune_journals() -> None:
+    """Delete journals of interrupted decks that were not resumed within the age limit."""
+    if not os.path.isdir(JOURNAL_PATH):
+        return
+    now = time.time()
+    for entry in os.scandir(JOURNAL_PATH):
+        if entry.is_file() and now - entry.stat().st_mtime > JOURNAL_MAX_AGE:
+            os.remove(entry.path)
+
+# Files uploaded or produced for out-of-band transfer, keyed by opaque handle
+file_handles = {}
+
+def prune_file_handles() -> None:
+    """Forget handles older than the retention period and delete the uploads they own."""
+    now = time.time()
+    for handle, entry in list(file_handles.items()):
+        if now - entry['created_at'] > FILE_RETENTION:
+            if entry['owned'] and os.path.exists(entry['path']):
+                os.remove(entry['path'])
+            del file_handles[handle]
+
+def register_file(path: str, file_name: str, owned: bool = False) -> str:
+    """Register a file for download and return its handle.
+
+    Args:
+        path (str): Path of the file on disk
+        file_name (str): File name presented to the client
+        owned (bool): Whether the file belongs to the file store and is deleted on expiry
+
+    Returns:
+        str: Opaque file handle
+    """
+    prune_file_handles()
+    handle = uuid.uuid4().hex
+    file_handles[handle] = {'path': path, 'file_name': file_name, 'owned': owned, 'created_at': time.time()}
+    return handle
+
+def get_file_entry(handle: str):
+    """Return the registry entry of a file handle, or None if it is unknown or expired."""
+    prune_file_handles()
+    entry = file_handles.get(handle)
+    if entry is None or not os.path.exists(entry['path']):
+        return None
+    return entry
+
+async def handle_file_upload(request):
+    """Stream an uploaded deck from the request body to disk and return a file handle.
+
+    The raw file is sent as the request body; the file name is given by the ``file_name``
+    query parameter.
+    """
+    file_name = normalize_file_name(request.query_params.get('file_name'))
+    os.makedirs(FILE_STORE_PATH, exist_ok=True)
+    path = os.path.join(FILE_STORE_PATH, uuid.uuid4().hex + os.path.splitext(file_name)[1])
+
+    size = 0
+    try:
+        with open(path, "wb") as f:
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise ValueError(f"File exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)}MB upload limit.")
+                f.write(chunk)
+    except Exception as e:
+        if os.path.exists(path):
+            os.remove(path)
+        print(f"[Error] File upload failed: {str(e)}")
+        return JSONResponse({"success": False, "message": f"Error uploading file: {str(e)}"}, status_code=400)
+
+    handle = register_file(path, file_name, owned=True)
+    print(f"[Info] Received upload '{file_name}' ({size} bytes) as handle {handle}")
+    return JSONResponse({"success": True, "file_handle": handle, "file_name": file_name, "size": size})
+
+async def handle_file_download(request):
+    """Stream a registered file back to the client."""
+    entry = get_file_entry(request.path_params['handle'])
+    if entry is None:
+        return JSONResponse({"success": False, "message": "Unknown or expired file handle."}, status_code=404)
+    return FileResponse(entry['path'], filename=entry['file_name'])
+
+def normalize_file_name(file_name: str) -> str:
+    """Return a usable PowerPoint file name for an upload."""
+    if not file_name:
+        return "uploaded_presentation.pptx"
+    if not (file_name.lower().endswith('.ppt') or file_name.lower().endswith('.pptx')):
+        return file_name + ".pptx"  # Add default extension
+    return file_name
+
+def decode_file_content(file_content) -> bytes:
+    """Decode uploaded file content given as bytes or a base64 encoded string.
+
+    Raises:
+        ValueError: If the content type is not supported
+    """
+    if isinstance(file_content, bytes):
+        return file_content
+    if isinstance(file_content, str):
+        # Try to decode base64 string
+        try:
+            return base64.b64decode(file_content)
+        except Exception as e:
+            print(f"[Warning] Base64 decoding failed: {str(e)}, attempting to write plain text")
+            # If not valid base64, treat as plain text
+            return file_content.encode('utf-8')
+    raise ValueError("Unsupported file content format. Please provide binary or base64 encoded file content.")
+
+def write_temp_file(file_bytes: bytes, ext: str) -> str:
+    """Write uploaded content to a temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
+        temp_file.write(file_bytes)
+        return temp_file.name
+
+def parse_target_languages(tlang) -> list:
+    """Return the target languages of a tool call as a list without duplicates."""
+    tlangs = [tlang] if isinstance(tlang, str) else list(tlang or [])
+    return list(dict.fromkeys(lang.strip() for lang in tlangs if lang and lang.strip()))
+
+async def translate_document(file_path: str, file_name: str, olang: str, tlangs: list, ctx=None,
+                             use_cache: bool = True, clear_cache: bool = False, progress_callback=None,
+                             paragraph_mode: bool = False, mode: str = 'final', preview_callback=None,
+                             backend: str = None) -> list:
+    """Translate an uploaded deck into one or more languages, reusing the whole-document cache.
+
+    Completed translations are journaled per deck and target language, so resubmitting a deck
+    whose translation was interrupted resumes where it stopped.
+
+    Args:
+        file_path (str): Path to the uploaded PowerPoint file
+        file_name (str): Normalized file name of the upload
+        olang (str): Original language code
+        tlangs (list): Target language codes
+        ctx: MCP context object
+        use_cache (bool): Whether to use the translation memory and document cache
+        clear_cache (bool): Clear the translation memory and journals and skip the document cache lookup
+        progress_callback: Optional async callable receiving (completed, total) text counts
+        paragraph_mode (bool): Translate multi-run paragraphs in one call with inline span markers
+        mode (str): Translation mode, 'final' or 'draft'
+        preview_callback: Optional async callable receiving each partially translated preview,
+            see translate_ppt_file_languages
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+
+    Returns:
+        list: One dict per target language with its ``language``, the ``file_name`` and ``path``
+            of the translated deck, whether it was ``cached`` and the translation ``summary``
+    """
+    if clear_cache:
+        translation_memory.clear()
+        print(f"[Info] Translation memory cleared")
+
+    name, ext = os.path.splitext(file_name)
+    results = {}
+    document_keys = {}
+    # Read the deck once, off the event loop, for the cache keys of all target languages
+    file_digest = await run_blocking(hash_file, file_path)
+    for tlang in tlangs:
+        if len(tlangs) == 1:
+            output_file_name = f'translated_{name}{ext}'
+        else:
+            output_file_name = f'translated_{name}_{get_language_suffix(tlang)}{ext}'
+        results[tlang] = {'language': tlang, 'file_name': output_file_name, 'path': None,
+                          'cached': False, 'summary': {}}
+
+        # Reuse the previous result if this exact deck was already translated into the language
+        document_keys[tlang] = get_document_cache_key(file_digest, olang, tlang, paragraph_mode, mode, backend)
+        if use_cache and not clear_cache:
+            cached_path = await run_blocking(lookup_document_cache, document_keys[tlang], ext,
+                                             os.path.join(RESULT_PATH, uuid.uuid4().hex, output_file_name))
+            if cached_path:
+                print(f"[Info] Returning cached translation ({tlang}): {cached_path}")
+                results[tlang].update({'path': cached_path, 'cached': True})
+
+    # Execute translation - directly use user-provided language parameters without validation or conversion
+    pending = [tlang for tlang in tlangs if not results[tlang]['cached']]
+    if pending:
+        # Resume from the journal of an earlier attempt at this deck that did not finish
+        prune_journals()
+        journals = {tlang: TranslationJournal(document_keys[tlang]) for tlang in pending}
+        resumed = {}
+        for tlang, journal in journals.items():
+            if clear_cache:
+                journal.remove()
+            resumed[tlang] = len(journal.entries)
+            if resumed[tlang]:
+                print(f"[Info] Resuming {resumed[tlang]} journaled translation(s) ({tlang})")
+
+        async def report_preview(preview):
+            # Name previews after the uploaded deck rather than its temporary copy
+            preview['file_name'] = 'preview_' + results[preview['language']]['file_name'].removeprefix('translated_')
+            await preview_callback(preview)
+
+        print("[Info] Starting translation process...")
+        summaries = {}
+        output_paths = await translate_ppt_file_languages(
+            file_path, olang, pending, ctx, use_cache=use_cache, progress_callback=progress_callback,
+            summaries=summaries, paragraph_mode=paragraph_mode, journals=journals, mode=mode,
+            preview_callback=report_preview if preview_callback else None, backend=backend
+        )
+        for tlang in pending:
+            print(f"[Info] Translation complete ({tlang}), result path: {output_paths[tlang]}")
+            summaries[tlang]['resumed_texts'] = resumed[tlang]
+            results[tlang].update({'path': output_paths[tlang], 'summary': summaries[tlang]})
+            if use_cache and not summaries[tlang]['failed_texts']:
+                await run_blocking(store_document_cache, document_keys[tlang], ext, output_paths[tlang])
+
+    return [results[tlang] for tlang in tlangs]
+
+def estimate_language(units: list, slides: list, olang: str, tlang: str, use_cache: bool = True,
+                      journal=None, mode: str = 'final', backend: str = None) -> dict:
+    """Estimate the translation work left for one target language, without calling the LLM.
+
+    Mirrors translate_units: unchanged slides are reused, identical texts are translated
+    once, untranslatable texts are skipped, journaled and cached texts are resolved up front,
+    and the rest is packed into batches. The translation memory is queried synchronously, so
+    estimate_document runs this in the worker executor.
+
+    Returns:
+        dict: Reuse, dedup and cache counts with the number of requests and estimated tokens
+    """
+    cache_model = get_cache_model(mode, backend)
+    pending = []
+    reused_slides = 0
+    for fingerprint, start, end in slides:
+        if use_cache and translation_memory.contains_slide(fingerprint, olang, tlang, cache_model):
+            reused_slides += 1
+        else:
+            pending.extend(range(start, end))
+
+    unit_slides = {index: start for _, start, end in slides for index in range(start, end)}
+    items = [{'text': units[index]['text'], 'plain_text': units[index].get('plain_text', units[index]['text']),
+              'slide': unit_slides[index]}
+             for index in pending]
+    text_index = build_text_index(items)
+    skipped = 0
+    cache_hits = 0
+    texts = []
+    for text, text_items in text_index.items():
+        if classify_untranslatable(text_items[0]['plain_text'].strip(), olang, tlang):
+            skipped += 1
+        elif (journal and journal.get(text) is not None) or (
+                use_cache and translation_memory.contains(text, olang, tlang, cache_model)):
+            cache_hits += 1
+        else:
+            texts.append(text)
+
+    limits = get_mode_batch_limits(mode)
+    overhead_tokens = get_batch_overhead_tokens(olang, tlang)
+    batches = pack_batches(texts, limits, [text_index[text][0]['slide'] for text in texts], overhead_tokens)
+    fill_ratios = get_batch_fill_ratios(texts, batches, limits, overhead_tokens)
+    estimated_tokens = sum(
+        estimate_request_tokens(build_translation_messages([texts[i] for i in batch], olang, tlang))
+        for batch in batches
+    )
+    return {
+        'cached_document': False,
+        'reused_slides': reused_slides,
+        'unique_texts': len(text_index),
+        'skipped_texts': skipped,
+        'cache_hits': cache_hits,
+        'texts_to_translate': len(texts),
+        'requests': len(batches),
+        'batch_fill_avg': round(sum(fill_ratios) / len(fill_ratios), 3) if fill_ratios else None,
+        'estimated_tokens': estimated_tokens,
+    }
+
+def estimate_wall_clock(requests: int, tokens: int, concurrency: int) -> float:
+    """Project the seconds needed for translation requests at the configured concurrency and rate limits."""
+    if not requests:
+        return 0.0
+
+    # Use the latency observed by this server when there is one
+    scheduler_stats = request_scheduler.stats
+    if scheduler_stats['completed']:
+        request_seconds = scheduler_stats['latency_total'] / scheduler_stats['completed']
+    else:
+        request_seconds = ESTIMATE_REQUEST_SECONDS
+    seconds = math.ceil(requests / max(1, concurrency)) * request_seconds
+
+    # Both buckets start full, so only the excess over one minute's budget has to wait
+    if RATE_LIMIT_RPM > 0:
+        seconds = max(seconds, (requests - RATE_LIMIT_RPM) * 60 / RATE_LIMIT_RPM)
+    if RATE_LIMIT_TPM > 0:
+        seconds = max(seconds, (tokens - RATE_LIMIT_TPM) * 60 / RATE_LIMIT_TPM)
+    return round(seconds, 1)
+
+async def estimate_document(file_path: str, file_name: str, olang: str, tlangs: list, use_cache: bool = True,
+                            paragraph_mode: bool = False, mode: str = 'final', backend: str = None) -> dict:
+    """Estimate the size, cost and duration of translating a deck, without calling the LLM.
+
+    The deck goes through the same extraction stage as a translation; the per-language work
+    is then derived from the document cache, slide reuse, journals and translation memory.
+
+    Args:
+        file_path (str): Path to the uploaded PowerPoint file
+        file_name (str): Normalized file name of the upload
+        olang (str): Original language code
+        tlangs (list): Target language codes
+        use_cache (bool): Whether the translation would use the translation memory and document cache
+        paragraph_mode (bool): Whether multi-run paragraphs would be translated with inline span markers
+        mode (str): Translation mode, 'final' or 'draft'
+        backend (str): Translation backend name, defaults to PPT_TRANSLATION_BACKEND
+
+    Returns:
+        dict: Deck counts, per-language estimates and projected totals
+    """
+    started = time.monotonic()
+    engine, _, frames, total_slides = await load_deck_text(file_path)
+    units, slides = build_slide_work_units(frames, paragraph_mode)
+    extraction_seconds = time.monotonic() - started
+
+    ext = os.path.splitext(file_name)[1]
+    languages = {}
+    file_digest = await run_blocking(hash_file, file_path)
+
+    def estimate_target(tlang):
+        # Reads the document cache, journal and translation memory, so it runs in the worker executor
+        document_key = get_document_cache_key(file_digest, olang, tlang, paragraph_mode, mode, backend)
+        if use_cache and os.path.exists(os.path.join(DOC_CACHE_PATH, document_key + ext)):
+            return {'cached_document': True, 'requests': 0, 'estimated_tokens': 0}
+        return estimate_language(units, slides, olang, tlang, use_cache, TranslationJournal(document_key), mode,
+                                 backend)
+
+    for tlang in tlangs:
+        languages[tlang] = await run_blocking(estimate_target, tlang)
+
+    requests = sum(estimate['requests'] for estimate in languages.values())
+    estimated_tokens = sum(estimate['estimated_tokens'] for estimate in languages.values())
+    # All target languages share the same request slots
+    concurrency = MAX_CONCURRENCY
+    return {
+        'engine': engine,
+        'mode': mode,
+        'model': get_mode_model(mode),
+        'backend': backend or TRANSLATION_BACKEND,
+        'slides': total_slides,
+        'runs': len(get_work_items(frames)),
+        'units': len(units),
+        'shared_frames': sum(1 for frame in frames if frame['slide'] == 0),
+        'extraction_seconds': round(extraction_seconds, 2),
+        'languages': languages,
+        'requests': requests,
+        'estimated_tokens': estimated_tokens,
+        'estimated_seconds': estimate_wall_clock(requests, estimated_tokens, concurrency),
+        'concurrency': concurrency,
+        'rate_limits': {'requests_per_minute': RATE_LIMIT_RPM, 'tokens_per_minute': RATE_LIMIT_TPM},
+    }
+
+def encode_file_result(result: dict, as_handle: bool) -> dict:
+    """Return the JSON fields carrying one translated file, as a download handle or base64 content.
+
+    A temporary file, such as a zip built for this response, is handed over to the file store
+    and deleted when its handle expires, or deleted right after it has been encoded.
+    """
+    temporary = result.get('temporary', False)
+    if as_handle:
+        handle = register_file(result['path'], result['file_name'], owned=temporary)
+        return {"file_name": result['file_name'], "file_handle": handle, "download_path": f"/files/{handle}"}
+
+    # Read the translated file and encode as base64
+    with open(result['path'], "rb") as f:
+        translated_file_content = base64.b64encode(f.read()).decode('utf-8')
+    if temporary:
+        os.remove(result['path'])
+    return {"file_name": result['file_name'], "file_content": translated_file_content}
+
+def build_zip_result(results: list) -> dict:
+    """Pack the translated files of several languages into one temporary zip file."""
+    base_name = os.path.splitext(results[0]['file_name'])[0]
+    suffix = '_' + get_language_suffix(results[0]['language'])
+    if base_name.endswith(suffix):
+        base_name = base_name[:-len(suffix)]
+
+    os.makedirs(OUTPUT_PATH, exist_ok=True)
+    zip_path = os.path.join(OUTPUT_PATH, f'{uuid.uuid4().hex}.zip')
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for result in results:
+            archive.write(result['path'], result['file_name'])
+
+    return {
+        'language': [result['language'] for result in results],
+        'file_name': f'{base_name}.zip',
+        'path': zip_path,
+        'temporary': True,
+        'cached': all(result['cached'] for result in results),
+        'summary': {result['language']: result['summary'] for result in results},
+    }
+
+def build_file_result(results: list, message: str, as_handle: bool = False, zip_output: bool = False) -> str:
+    """Build the JSON tool result for the translated decks.
+
+    A single language is returned as one file. Several languages are returned as a
+    ``files`` list, or as a single zip file when ``zip_output`` is set.
+
+    Args:
+        results (list): Result of translate_document
+        message (str): Message returned to the caller
+        as_handle (bool): Return download handles instead of base64 encoded file content
+        zip_output (bool): Pack several languages into one zip file
+
+    Returns:
+        str: JSON tool result
+    """
+    if len(results) > 1 and zip_output:
+        results = [build_zip_result(results)]
+
+    if all(result['cached'] for result in results):
+        message += " (cached result)"
+
+    if len(results) == 1:
+        # Return JSON containing necessary information
+        result_json = {"success": True, "message": message}
+        result_json.update(encode_file_result(results[0], as_handle))
+        result_json["summary"] = results[0]['summary']
+        return json.dumps(result_json)
+
+    files = []
+    for result in results:
+        file_json = {"language": result['language']}
+        file_json.update(encode_file_result(result, as_handle))
+        file_json["cached"] = result['cached']
+        file_json["summary"] = result['summary']
+        files.append(file_json)
+    return json.dumps({"success": True, "message": message, "files": files})
+
+def resolve_input_file(file_content, file_name: str, file_handle: str):
+    """Resolve the uploaded deck of a tool call to a file on disk.
+
+    A file handle from the upload endpoint takes precedence; otherwise the legacy base64
+    content is written to a temporary file.
+
+    Returns:
+        tuple: (file_path, file_name, is_temporary)
+
+    Raises:
+        ValueError: If no usable file was provided
+    """
+    if file_handle:
+        entry = get_file_entry(file_handle)
+        if entry is None:
+            raise ValueError(f"Unknown or expired file handle '{file_handle}'.")
+        return entry['path'], normalize_file_name(file_name or entry['file_name']), False
+
+    if not file_content:
+        raise ValueError("PowerPoint file content is required. Please upload the file and provide the content.")
+
+    file_name = normalize_file_name(file_name)
+    file_bytes = decode_file_content(file_content)
+    return write_temp_file(file_bytes, os.path.splitext(file_name)[1]), file_name, True
+
 @mcp.tool()
-async def translate_ppt(olang: str, tlang: str, file_content: str = None, file_name: str = None) -> str:
+async def translate_ppt(olang: str, tlang: str | list[str], file_content: str = None, file_name: str = None,
+                        use_cache: bool = True, clear_cache: bool = False, file_handle: str = None,
+                        paragraph_mode: bool = None, zip_output: bool = False, mode: str = 'final',
+                        backend: str = None) -> str:
     """
     Translate a PowerPoint file from one language to another while preserving the original format.
 
@@ -394,14 +3102,26 @@ async def translate_ppt(olang: str, tlang: str, file_content: str = None, file_n
 
     ## Parameter Description
     :param olang: Source language code or name, e.g., 'zh-TW', 'Traditional Chinese', 'english', etc.
-    :param tlang: Target language code or name, e.g., 'en', 'English', 'japanese', etc.
+    :param tlang: Target language code or name, e.g., 'en', 'English', 'japanese', etc.,
+                  or a list of them to translate the deck into several languages at once
     :param file_content: Content of the PowerPoint file (base64 encoded string)
     :param file_name: File name (optional, used to determine file type)
+    :param use_cache: Reuse and store translations in the translation memory (optional, default True)
+    :param clear_cache: Clear the translation memory before translating (optional, default False)
+    :param file_handle: Handle returned by the server's `POST /files` upload endpoint, used instead of file_content
+    :param paragraph_mode: Translate each multi-run paragraph in one call, keeping sentences split across
+                           styled runs together (optional, defaults to the PPT_PARAGRAPH_MODE setting)
+    :param zip_output: Return the decks of several target languages as one zip file (optional, default False)
+    :param mode: 'final' for careful translation, or 'draft' for a fast preview with a cheaper model and larger
+                 batches (optional, default 'final')
+    :param backend: Translation backend, 'openai', 'dictionary' (offline word list) or 'replay' (recorded
+                    translations) (optional, defaults to the PPT_TRANSLATION_BACKEND setting)
 
     ## Input Example
     - From Chinese to English: olang="Chinese", tlang="English"
     - From English to Japanese: olang="english", tlang="japanese"
     - From Japanese to Chinese: olang="ja", tlang="zh-TW"
+    - From English to several languages: olang="en", tlang=["ja", "fr", "de"]
 
     ## File Requirements
     - Supports .ppt and .pptx formats
@@ -410,10 +3130,13 @@ async def translate_ppt(olang: str, tlang: str, file_content: str = None, file_n
 
     ## Notes
     - Translating large files may take several minutes
+    - For large files prefer `submit_translation`, which returns immediately and can be polled
     - Complex charts and special formats might not be perfectly preserved
     - Proper nouns may require manual correction
 
-    :return: JSON string containing the translation result message and file content
+    :return: JSON string containing the translation result message and file content,
+             or a `file_handle` to download from `GET /files/{handle}` when the input was a file handle.
+             Several target languages are returned as a `files` list, one entry per language.
     """
     # Get MCP context
     try:
@@ -426,99 +3149,421 @@ async def translate_ppt(olang: str, tlang: str, file_content: str = None, file_n
     try:
         print(f"\n========== PPT Translator Tool Started ==========")
         print(f"[Parameter] Source language: {olang}")
-        print(f"[Parameter] Target language: {tlang}")
-
-
-
-        # Check necessary parameters
-        if not file_content:
-            print(f"[Error] File content not provided")
+        tlangs = parse_target_languages(tlang)
+        print(f"[Parameter] Target language: {', '.join(tlangs)}")
+        if not tlangs:
+            return json.dumps({"success": False, "message": "Error: No target language specified."})
+        if paragraph_mode is None:
+            paragraph_mode = PARAGRAPH_MODE
+        if mode not in TRANSLATION_MODES:
+            return json.dumps({"success": False, "message": f"Error: Unknown translation mode '{mode}'."})
+        backend = backend or TRANSLATION_BACKEND
+        if backend not in TRANSLATION_BACKENDS:
+            return json.dumps({"success": False, "message": f"Error: Unknown translation backend '{backend}'."})
+        print(f"[Parameter] Mode: {mode}, backend: {backend}")
+
+        # Resolve the uploaded file
+        try:
+            file_path, file_name, is_temporary = resolve_input_file(file_content, file_name, file_handle)
+        except Exception as e:
+            print(f"[Error] Error processing file content: {str(e)}")
             return json.dumps({
                 "success": False,
-                "message": "Error: PowerPoint file content is required. Please upload the file and provide the content."
+                "message": f"Error processing file content: {str(e)}"
             })
 
-        # Ensure file name is valid
-        if not file_name:
-            file_name = "uploaded_presentation.pptx"
+        try:
+            results = await translate_document(file_path, file_name, olang, tlangs, ctx,
+                                               use_cache=use_cache, clear_cache=clear_cache,
+                                               paragraph_mode=paragraph_mode, mode=mode, backend=backend)
+        finally:
+            # Clean up temporary file
+            if is_temporary and os.path.exists(file_path):
+                os.remove(file_path)
+        result_json = build_file_result(results, "Translation complete!", as_handle=bool(file_handle),
+                                        zip_output=zip_output)
 
-        elif not (file_name.lower().endswith('.ppt') or file_name.lower().endswith('.pptx')):
-            old_name = file_name
-            file_name += ".pptx"  # Add default extension
+        print(f"========== PPT Translator Tool Finished ==========\n")
+        return result_json
 
-        # Create a temporary file to store the uploaded content
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file_name)[1]) as temp_file:
-            # Write file content directly
-            try:
-                if isinstance(file_content, bytes):
+    except Exception as e:
+        print(f"[Error] Translator tool execution error: {str(e)}")
+        error_result = json.dumps({
+            "success": False,
+            "message": f"Error during translation process: {str(e)}"
+        })
+        print(f"========== PPT Translator Tool Error ==========\n")
+        return error_result
 
-                    temp_file.write(file_content)
-                elif isinstance(file_content, str):
+@mcp.tool()
+async def estimate_translation(olang: str, tlang: str | list[str], file_content: str = None, file_name: str = None,
+                               use_cache: bool = True, file_handle: str = None, paragraph_mode: bool = None,
+                               mode: str = 'final', backend: str = None) -> str:
+    """
+    Estimate the size, token cost and duration of translating a PowerPoint file, without translating it.
 
-                    # Try to decode base64 string
-                    try:
-                        decoded_content = base64.b64decode(file_content)
-                        temp_file.write(decoded_content)
+    The deck is parsed with the same extraction stage as `translate_ppt`, but no LLM call is made.
+    Use it before large translations to warn the user about long or expensive jobs.
 
-                    except Exception as e:
-                        print(f"[Warning] Base64 decoding failed: {str(e)}, attempting to write plain text")
-                        # If not valid base64, treat as plain text
-                        encoded_content = file_content.encode('utf-8')
-                        temp_file.write(encoded_content)
+    ## Parameter Description
+    :param olang: Source language code or name, e.g., 'zh-TW', 'Traditional Chinese', 'english', etc.
+    :param tlang: Target language code or name, or a list of them
+    :param file_content: Content of the PowerPoint file (base64 encoded string)
+    :param file_name: File name (optional, used to determine file type)
+    :param use_cache: Count texts already in the translation memory and document cache as free (optional, default True)
+    :param file_handle: Handle returned by the server's `POST /files` upload endpoint, used instead of file_content
+    :param paragraph_mode: Estimate paragraph mode translation (optional, defaults to the PPT_PARAGRAPH_MODE setting)
+    :param mode: Estimate a 'final' or 'draft' translation (optional, default 'final')
+    :param backend: Translation backend whose cached translations are counted (optional, defaults to the
+                    PPT_TRANSLATION_BACKEND setting)
+
+    :return: JSON string with slide, run and unique text counts, expected cache hits, estimated tokens,
+             number of requests and projected seconds at the current concurrency and rate limits
+    """
+    tlangs = parse_target_languages(tlang)
+    if not tlangs:
+        return json.dumps({"success": False, "message": "Error: No target language specified."})
+    if paragraph_mode is None:
+        paragraph_mode = PARAGRAPH_MODE
+    if mode not in TRANSLATION_MODES:
+        return json.dumps({"success": False, "message": f"Error: Unknown translation mode '{mode}'."})
+    backend = backend or TRANSLATION_BACKEND
+    if backend not in TRANSLATION_BACKENDS:
+        return json.dumps({"success": False, "message": f"Error: Unknown translation backend '{backend}'."})
 
-                else:
-                    print(f"[Error] Unsupported file content type: {type(file_content)}")
-                    return json.dumps({
-                        "success": False,
-                        "message": "Error: Unsupported file content format. Please provide binary or base64 encoded file content."
-                    })
+    try:
+        file_path, file_name, is_temporary = resolve_input_file(file_content, file_name, file_handle)
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "message": f"Error processing file content: {str(e)}"
+        })
 
-                temp_file_path = temp_file.name
+    try:
+        estimate = await estimate_document(file_path, file_name, olang, tlangs, use_cache=use_cache,
+                                           paragraph_mode=paragraph_mode, mode=mode, backend=backend)
+    except Exception as e:
+        print(f"[Error] Estimation error: {str(e)}")
+        return json.dumps({"success": False, "message": f"Error during estimation: {str(e)}"})
+    finally:
+        if is_temporary and os.path.exists(file_path):
+            os.remove(file_path)
+
+    print(f"[Info] Estimated {estimate['requests']} request(s), {estimate['estimated_tokens']} token(s), "
+          f"{estimate['estimated_seconds']}s for {file_name}")
+    result_json = {"success": True, "message": "Estimate complete, no translation was performed."}
+    result_json.update(estimate)
+    return json.dumps(result_json)
+
+# In-process translation jobs, keyed by job id
+translation_jobs = {}
+_job_queue = None
+_job_workers = []
+
+def prune_translation_jobs() -> None:
+    """Forget finished jobs older than the retention period."""
+    now = time.time()
+    for job_id, job in list(translation_jobs.items()):
+        if job['finished_at'] and now - job['finished_at'] > JOB_RETENTION:
+            release_job_previews(job)
+            del translation_jobs[job_id]
+
+def ensure_job_workers() -> None:
+    """Start the job worker tasks on the running event loop if they are not running yet."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = asyncio.Queue()
+    _job_workers[:] = [worker for worker in _job_workers if not worker.done()]
+    while len(_job_workers) < JOB_WORKERS:
+        _job_workers.append(asyncio.create_task(translation_job_worker()))
+
+async def translation_job_worker() -> None:
+    """Take queued jobs off the job queue and run them one at a time."""
+    while True:
+        job_id = await _job_queue.get()
+        job = translation_jobs.get(job_id)
+        if job is None or job['status'] != 'queued':
+            continue
+
+        job['status'] = 'running'
+        job['started_at'] = time.time()
+        print(f"[Job {job_id}] Started")
+
+        async def update_progress(completed, total):
+            job['completed'] = completed
+            job['total'] = total
+
+        async def update_preview(preview):
+            preview['updated_at'] = time.time()
+            job['previews'][preview['language']] = preview
+
+        job['task'] = asyncio.create_task(translate_document(
+            job['file_path'], job['file_name'], job['olang'], job['tlangs'],
+            use_cache=job['use_cache'], clear_cache=job['clear_cache'], progress_callback=update_progress,
+            paragraph_mode=job['paragraph_mode'], mode=job['mode'], preview_callback=update_preview,
+            backend=job['backend']
+        ))
+        try:
+            job['result'] = await job['task']
+            job['status'] = 'completed'
+            # The final files supersede the previews
+            release_job_previews(job)
+            print(f"[Job {job_id}] Completed")
+        except asyncio.CancelledError:
+            if job['status'] != 'cancelled':
+                # The worker itself is being cancelled
+                raise
+            print(f"[Job {job_id}] Cancelled")
+        except Exception as e:
+            job['status'] = 'failed'
+            job['error'] = str(e)
+            print(f"[Job {job_id}] Failed: {str(e)}")
+        finally:
+            job['task'] = None
+            job['finished_at'] = time.time()
+            release_job_input(job)
+
+def release_job_input(job: dict) -> None:
+    """Delete the temporary input file of a job once it is no longer needed."""
+    if job['is_temporary'] and job['file_path'] and os.path.exists(job['file_path']):
+        os.remove(job['file_path'])
+    job['file_path'] = None
+
+def release_job_previews(job: dict) -> None:
+    """Delete the preview decks of a job."""
+    for preview in job['previews'].values():
+        if os.path.exists(preview['path']):
+            os.remove(preview['path'])
+    job['previews'] = {}
+
+def get_job_status(job: dict) -> dict:
+    """Build the status report of a job, including percent complete and ETA."""
+    percent = 0.0
+    eta = None
+    if job['status'] == 'completed':
+        percent = 100.0
+        eta = 0.0
+    elif job['total']:
+        percent = round(job['completed'] / job['total'] * 100, 1)
+        if job['status'] == 'running' and job['completed']:
+            elapsed = time.time() - job['started_at']
+            eta = round(elapsed / job['completed'] * (job['total'] - job['completed']), 1)
+
+    status = {
+        "success": True,
+        "job_id": job['id'],
+        "status": job['status'],
+        "percent_complete": percent,
+        "eta_seconds": eta,
+        "completed_items": job['completed'],
+        "total_items": job['total'],
+        "preview_available": bool(job['previews']),
+    }
+    if job['result']:
+        if len(job['result']) == 1:
+            status["summary"] = job['result'][0]['summary']
+        else:
+            status["summary"] = {result['language']: result['summary'] for result in job['result']}
+    if job['error']:
+        status["message"] = job['error']
+    return status
 
-            except Exception as e:
-                print(f"[Error] Error processing file content: {str(e)}")
-                return json.dumps({
-                    "success": False,
-                    "message": f"Error processing file content: {str(e)}."
-                })
+@mcp.tool()
+async def submit_translation(olang: str, tlang: str | list[str], file_content: str = None, file_name: str = None,
+                             use_cache: bool = True, clear_cache: bool = False, file_handle: str = None,
+                             paragraph_mode: bool = None, zip_output: bool = False, mode: str = 'final',
+                             backend: str = None) -> str:
+    """
+    Submit a PowerPoint translation job and return immediately with a job id.
 
-        # Execute translation - directly use user-provided language parameters without validation or conversion
-        print("[Info] Starting translation process...")
-        output_path = await translate_ppt_file(temp_file_path, olang, tlang, ctx)
-        print(f"[Info] Translation complete, result path: {output_path}")
+    Use `get_translation_status` to poll progress, `get_translation_result` to fetch the translated
+    file once the job is completed, and `cancel_translation` to stop it.
 
-        # Clean up temporary file
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
+    ## Parameter Description
+    :param olang: Source language code or name, e.g., 'zh-TW', 'Traditional Chinese', 'english', etc.
+    :param tlang: Target language code or name, e.g., 'en', 'English', 'japanese', etc.,
+                  or a list of them to translate the deck into several languages at once
+    :param file_content: Content of the PowerPoint file (base64 encoded string)
+    :param file_name: File name (optional, used to determine file type)
+    :param use_cache: Reuse and store translations in the translation memory (optional, default True)
+    :param clear_cache: Clear the translation memory before translating (optional, default False)
+    :param file_handle: Handle returned by the server's `POST /files` upload endpoint, used instead of file_content
+    :param paragraph_mode: Translate each multi-run paragraph in one call, keeping sentences split across
+                           styled runs together (optional, defaults to the PPT_PARAGRAPH_MODE setting)
+    :param zip_output: Return the decks of several target languages as one zip file (optional, default False)
+    :param mode: 'final' for careful translation, or 'draft' for a fast preview with a cheaper model and larger
+                 batches (optional, default 'final')
+    :param backend: Translation backend, 'openai', 'dictionary' (offline word list) or 'replay' (recorded
+                    translations) (optional, defaults to the PPT_TRANSLATION_BACKEND setting)
+
+    :return: JSON string containing the job id
+    """
+    tlangs = parse_target_languages(tlang)
+    if not tlangs:
+        return json.dumps({"success": False, "message": "Error: No target language specified."})
+    if mode not in TRANSLATION_MODES:
+        return json.dumps({"success": False, "message": f"Error: Unknown translation mode '{mode}'."})
+    backend = backend or TRANSLATION_BACKEND
+    if backend not in TRANSLATION_BACKENDS:
+        return json.dumps({"success": False, "message": f"Error: Unknown translation backend '{backend}'."})
 
-        # Read the translated file and encode as base64
-        with open(output_path, "rb") as f:
-            file_bytes = f.read()
+    try:
+        file_path, file_name, is_temporary = resolve_input_file(file_content, file_name, file_handle)
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "message": f"Error processing file content: {str(e)}"
+        })
 
-            translated_file_content = base64.b64encode(file_bytes).decode('utf-8')
+    prune_translation_jobs()
+    ensure_job_workers()
+
+    job_id = uuid.uuid4().hex
+    translation_jobs[job_id] = {
+        'id': job_id,
+        'status': 'queued',
+        'olang': olang,
+        'tlangs': tlangs,
+        'file_name': file_name,
+        'file_path': file_path,
+        'is_temporary': is_temporary,
+        'as_handle': bool(file_handle),
+        'zip_output': zip_output,
+        'paragraph_mode': PARAGRAPH_MODE if paragraph_mode is None else bool(paragraph_mode),
+        'mode': mode,
+        'backend': backend,
+        'use_cache': use_cache,
+        'clear_cache': clear_cache,
+        'completed': 0,
+        'total': 0,
+        'submitted_at': time.time(),
+        'started_at': None,
+        'finished_at': None,
+        'task': None,
+        'result': None,
+        'error': None,
+        'previews': {},
+    }
+    _job_queue.put_nowait(job_id)
+    print(f"[Job {job_id}] Queued translation from {olang} to {', '.join(tlangs)}")
 
-        # Get the output file name
-        output_file_name = os.path.basename(output_path)
+    return json.dumps({
+        "success": True,
+        "job_id": job_id,
+        "status": "queued",
+        "message": "Translation job submitted."
+    })
 
-        # Return JSON containing necessary information
-        result_json = json.dumps({
-            "success": True,
-            "message": "Translation complete!",
-            "file_name": output_file_name,
-            "file_content": translated_file_content
-        })
+@mcp.tool()
+async def get_translation_status(job_id: str) -> str:
+    """
+    Get the status of a translation job submitted with `submit_translation`.
 
-        print(f"========== PPT Translator Tool Finished ==========\n")
-        return result_json
+    :param job_id: Job id returned by `submit_translation`
+    :return: JSON string with status ('queued', 'running', 'completed', 'failed' or 'cancelled'),
+             percent complete and estimated seconds remaining
+    """
+    job = translation_jobs.get(job_id)
+    if job is None:
+        return json.dumps({"success": False, "message": f"Error: Unknown job id '{job_id}'."})
+    return json.dumps(get_job_status(job))
+
+@mcp.tool()
+async def get_translation_result(job_id: str) -> str:
+    """
+    Get the translated PowerPoint file of a completed translation job.
+
+    :param job_id: Job id returned by `submit_translation`
+    :return: JSON string containing the translation result message and file content,
+             or a `file_handle` when the job was submitted with a file handle.
+             Several target languages are returned as a `files` list, one entry per language.
+    """
+    job = translation_jobs.get(job_id)
+    if job is None:
+        return json.dumps({"success": False, "message": f"Error: Unknown job id '{job_id}'."})
+
+    if job['status'] != 'completed':
+        status = get_job_status(job)
+        status["success"] = False
+        status["message"] = job['error'] or f"Translation job is {job['status']}."
+        return json.dumps(status)
 
+    try:
+        return build_file_result(job['result'], "Translation complete!", as_handle=job['as_handle'],
+                                 zip_output=job['zip_output'])
     except Exception as e:
-        print(f"[Error] Translator tool execution error: {str(e)}")
-        error_result = json.dumps({
+        return json.dumps({"success": False, "message": f"Error reading translated file: {str(e)}"})
+
+@mcp.tool()
+async def get_translation_preview(job_id: str) -> str:
+    """
+    Get the latest partially translated preview of a translation job that is still running.
+
+    Previews are written periodically while the texts are being translated; text that is not
+    translated yet is still in the source language. Use `get_translation_result` for the final file.
+
+    :param job_id: Job id returned by `submit_translation`
+    :return: JSON string containing the preview file content, or a `file_handle` when the job was
+             submitted with a file handle, with the number of translated and total units.
+             Several target languages are returned as a `files` list, one entry per language.
+    """
+    job = translation_jobs.get(job_id)
+    if job is None:
+        return json.dumps({"success": False, "message": f"Error: Unknown job id '{job_id}'."})
+
+    previews = [job['previews'][tlang] for tlang in job['tlangs'] if tlang in job['previews']]
+    if not previews:
+        status = get_job_status(job)
+        status["success"] = False
+        status["message"] = "No preview is available for this job yet."
+        return json.dumps(status)
+
+    results = [
+        {'language': preview['language'], 'file_name': preview['file_name'], 'path': preview['path'],
+         'cached': False, 'summary': {'translated_units': preview['translated_units'],
+                                      'total_units': preview['total_units']}}
+        for preview in previews
+    ]
+    try:
+        return build_file_result(results, "Preview of a translation in progress.", as_handle=job['as_handle'],
+                                 zip_output=job['zip_output'])
+    except Exception as e:
+        return json.dumps({"success": False, "message": f"Error reading preview file: {str(e)}"})
+
+@mcp.tool()
+async def cancel_translation(job_id: str) -> str:
+    """
+    Cancel a queued or running translation job.
+
+    :param job_id: Job id returned by `submit_translation`
+    :return: JSON string with the resulting job status
+    """
+    job = translation_jobs.get(job_id)
+    if job is None:
+        return json.dumps({"success": False, "message": f"Error: Unknown job id '{job_id}'."})
+
+    if job['status'] in ('completed', 'failed', 'cancelled'):
+        return json.dumps({
             "success": False,
-            "message": f"Error during translation process: {str(e)}"
+            "job_id": job_id,
+            "status": job['status'],
+            "message": f"Translation job is already {job['status']}."
         })
-        print(f"========== PPT Translator Tool Error ==========\n")
-        return error_result
+
+    was_queued = job['status'] == 'queued'
+    job['status'] = 'cancelled'
+    if job['task']:
+        job['task'].cancel()
+    if was_queued:
+        job['finished_at'] = time.time()
+        release_job_input(job)
+
+    return json.dumps({
+        "success": True,
+        "job_id": job_id,
+        "status": "cancelled",
+        "message": "Translation job cancelled."
+    })
 
 @mcp.resource("translator://instructions")
 async def get_instructions() -> str:
@@ -569,6 +3614,9 @@ if __name__ == "__main__":
 
     # Start MCP server
     print(f"Starting PPT Translator Server on port {args.port}")
+    if get_mode_model('draft') == TRANSLATION_MODEL:
+        print(f"[Warning] PPT_DRAFT_MODEL is not set to a cheaper model than MODEL, draft mode uses "
+              f"{TRANSLATION_MODEL} and only differs by its larger batches")
 
     # Create SSE transport
     sse = SseServerTransport("/mcp/")
@@ -589,6 +3637,9 @@ if __name__ == "__main__":
         routes=[
             # SSE endpoint
             Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            # Out-of-band file transfer endpoints
+            Route("/files", endpoint=handle_file_upload, methods=["POST"]),
+            Route("/files/{handle}", endpoint=handle_file_download, methods=["GET"]),
             Mount("/mcp/", app=sse.handle_post_message)
         ]
     )
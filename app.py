@@ -14,6 +14,7 @@ from mcp_server_config import SERVER_CONFIGS # Import shared config
 
 import base64
 import tempfile
+import httpx
 from copy import deepcopy
 from langchain_community.tools import tool
 from langchain_core.pydantic_v1 import BaseModel, Field
@@ -442,6 +443,144 @@ def add_upload_ppt_tool(tools):
     
     return enhanced_tools
 
+def get_ppt_translator_url():
+    """Get the base HTTP URL of the PPT translator server"""
+    return f"http://localhost:{SERVER_CONFIGS['ppt_translator']['port']}"
+
+async def upload_ppt_file(file_path, file_name, chunk_size=1024 * 1024):
+    """Stream a file to the translator server's upload endpoint.
+    
+    Parameters:
+        file_path (str): The path of the file to upload
+        file_name (str): The file name sent to the server
+        chunk_size (int): The size of the streamed chunks
+        
+    Returns:
+        str: The file handle, or None if the upload failed
+    """
+    async def read_chunks():
+        with open(file_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+    
+    try:
+        async with httpx.AsyncClient(timeout=120) as client:
+            response = await client.post(
+                f"{get_ppt_translator_url()}/files",
+                params={"file_name": file_name},
+                content=read_chunks()
+            )
+            response.raise_for_status()
+            return response.json().get("file_handle")
+    except Exception as e:
+        print(f"File upload failed, falling back to base64 content: {str(e)}")
+        return None
+
+async def download_ppt_file(file_handle, output_path):
+    """Stream a translated file from the translator server to a local path.
+    
+    Parameters:
+        file_handle (str): The file handle returned by the translation tool
+        output_path (str): The local path to write the file to
+    """
+    async with httpx.AsyncClient(timeout=120) as client:
+        async with client.stream("GET", f"{get_ppt_translator_url()}/files/{file_handle}") as response:
+            response.raise_for_status()
+            with open(output_path, "wb") as f:
+                async for chunk in response.aiter_bytes():
+                    f.write(chunk)
+
+async def save_ppt_result_file(result_dict, default_file_name):
+    """Save the file of a translation tool result to a temporary path.
+    
+    Parameters:
+        result_dict (dict): The parsed JSON result carrying a file handle or base64 file content
+        default_file_name (str): The file name used when the result does not carry one
+        
+    Returns:
+        tuple: The file name and the local path of the saved file
+    """
+    file_name = result_dict.get("file_name", default_file_name)
+    output_path = os.path.join(tempfile.gettempdir(), file_name)
+    
+    if result_dict.get("file_handle"):
+        # download the file from the translator server
+        await download_ppt_file(result_dict["file_handle"], output_path)
+    else:
+        # decode the base64 content to binary
+        binary_content = base64.b64decode(result_dict.get("file_content"))
+        with open(output_path, "wb") as f:
+            f.write(binary_content)
+    return file_name, output_path
+
+async def send_ppt_preview(tools, job_id):
+    """Offer the partially translated preview of a running job as an early download.
+    
+    Parameters:
+        tools (dict): The available MCP tools by name
+        job_id (str): The translation job id
+        
+    Returns:
+        bool: True if a preview was sent
+    """
+    try:
+        preview_dict = json.loads(await tools["get_translation_preview"].ainvoke({"job_id": job_id}))
+        if not preview_dict.get("success", False):
+            return False
+        
+        preview_file_name, preview_path = await save_ppt_result_file(preview_dict, "preview_document.pptx")
+        summary = preview_dict.get("summary", {})
+        await cl.Message(
+            content=f"Translation still in progress, here is an early preview "
+                    f"({summary.get('translated_units', 0)}/{summary.get('total_units', 0)} texts translated so far):",
+            elements=[cl.File(name=preview_file_name, path=preview_path, display="inline")]
+        ).send()
+        return True
+    except Exception as e:
+        print(f"Preview download failed: {str(e)}")
+        return False
+
+async def run_ppt_translation_job(tools, params, processing_msg, poll_interval=2):
+    """Run a PPT translation through the job tools, showing progress while polling.
+    
+    The first partially translated preview of the job, when the server offers one, is sent
+    to the user as an early download.
+    
+    Parameters:
+        tools (dict): The available MCP tools by name
+        params (dict): The translation parameters
+        processing_msg (cl.Message): The message to update with the progress
+        poll_interval (float): Seconds between status polls
+        
+    Returns:
+        str: The JSON result of get_translation_result, or of the failed submission
+    """
+    submit_result = await tools["submit_translation"].ainvoke(params)
+    submit_dict = json.loads(submit_result)
+    if not submit_dict.get("success", False):
+        return submit_result
+    
+    job_id = submit_dict["job_id"]
+    preview_sent = "get_translation_preview" not in tools
+    while True:
+        await asyncio.sleep(poll_interval)
+        status = json.loads(await tools["get_translation_status"].ainvoke({"job_id": job_id}))
+        if not status.get("success", False) or status.get("status") not in ("queued", "running"):
+            break
+        
+        # show the progress to the user
+        progress = f"Translating... {status.get('percent_complete', 0)}%"
+        if status.get("eta_seconds") is not None:
+            progress += f" (about {int(status['eta_seconds'])}s remaining)"
+        processing_msg.content = progress
+        await processing_msg.update()
+        
+        # offer an early preview download once the server has written one
+        if not preview_sent and status.get("preview_available"):
+            preview_sent = await send_ppt_preview(tools, job_id)
+    
+    return await tools["get_translation_result"].ainvoke({"job_id": job_id})
+
 # Process the PPT file upload and translation function
 async def handle_ppt_translation(olang: str, tlang: str):
     """Process the PowerPoint translation request.
@@ -485,55 +624,47 @@ async def handle_ppt_translation(olang: str, tlang: str):
     await processing_msg.send()
     
     try:
-        # read the file content
-        with open(file_path, "rb") as f:
-            file_content = f.read()
-        
-        # convert the binary file content to a base64 string
-        file_content_base64 = base64.b64encode(file_content).decode('utf-8')
-        
         # prepare the MCP client invocation parameters
         params = {
             "olang": olang,
             "tlang": tlang,
-            "file_content": file_content_base64,
             "file_name": file_name
         }
         
+        # stream the file to the translator server, fall back to base64 content if the upload fails
+        file_handle = await upload_ppt_file(file_path, file_name)
+        if file_handle:
+            params["file_handle"] = file_handle
+        else:
+            with open(file_path, "rb") as f:
+                params["file_content"] = base64.b64encode(f.read()).decode('utf-8')
+        
         # get the available tools list
         mcp_client = cl.user_session.get("mcp_client")
-        tools = mcp_client.get_tools()
-        translate_ppt_tool = None
-        
-        # find the translation tool
-        for tool in tools:
-            if tool.name == "translate_ppt":
-                translate_ppt_tool = tool
-                break
-        
-        # call the translation tool
-        if translate_ppt_tool:
+        tools = {tool.name: tool for tool in mcp_client.get_tools()}
+        translate_ppt_tool = tools.get("translate_ppt")
+        
+        # prefer the asynchronous job tools, which keep the session responsive for large files
+        job_tool_names = ("submit_translation", "get_translation_status", "get_translation_result")
+        if all(name in tools for name in job_tool_names):
+            result = await run_ppt_translation_job(tools, params, processing_msg)
+        elif translate_ppt_tool:
             result = await translate_ppt_tool.ainvoke(params)
-            
+        else:
+            result = None
+        
+        # process the translation result
+        if result is not None:
             # check the result format
             if isinstance(result, str):
                 # try to parse the JSON string
                 try:
                     result_dict = json.loads(result)
                     if result_dict.get("success", False):
-                        # extract the file content and file name from the response
-                        translated_file_content = result_dict.get("file_content")
-                        translated_file_name = result_dict.get("file_name", "translated_document.pptx")
-                        
-                        # decode the base64 content to binary
-                        binary_content = base64.b64decode(translated_file_content)
-                        
-                        # create a temporary file
-                        temp_dir = tempfile.gettempdir()
-                        output_path = os.path.join(temp_dir, translated_file_name)
-                        
-                        with open(output_path, "wb") as f:
-                            f.write(binary_content)
+                        # save the translated file to a temporary path
+                        translated_file_name, output_path = await save_ppt_result_file(
+                            result_dict, "translated_document.pptx"
+                        )
                         
                         # create a file element and send it in the message
                         file_element = cl.File(
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+PPT Translator Benchmark - Measure translation throughput offline
+
+Generates a synthetic .pptx deck, translates it with `translate_ppt_file` against a
+deterministic local fake chat model, and reports wall time, LLM calls, CPU time and
+peak RSS. Results are saved as JSON and can be compared with an earlier run.
+
+Example:
+    python benchmarks/ppt_translator_benchmark.py --slides 200 --duplicate-ratio 0.3 --latency 0.2
+    python benchmarks/ppt_translator_benchmark.py --output new.json --compare baseline.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'MCP_Servers'))
+import ppt_translator_server as translator  # noqa: E402
+
+WORDS = (
+    "market revenue growth customer product strategy quarter team launch roadmap platform "
+    "analysis forecast budget risk partner region sales support design quality release "
+    "pipeline target review process network service insight value"
+).split()
+
+# Metrics compared between runs, lower is better for all of them
+COMPARED_METRICS = ('wall_seconds', 'cpu_seconds', 'llm_calls', 'peak_rss_mb')
+
+
+def parse_args():
+    """Parse the benchmark command line."""
+    parser = argparse.ArgumentParser(description='PPT Translator benchmark with synthetic decks and a fake LLM')
+    parser.add_argument('--slides', type=int, default=50, help='Number of slides (default: 50)')
+    parser.add_argument('--shapes', type=int, default=4, help='Text boxes per slide (default: 4)')
+    parser.add_argument('--paragraphs', type=int, default=3, help='Paragraphs per text box (default: 3)')
+    parser.add_argument('--runs', type=int, default=2, help='Runs per paragraph (default: 2)')
+    parser.add_argument('--tables', type=int, default=0, help='Tables per slide (default: 0)')
+    parser.add_argument('--table-size', type=int, default=4, help='Rows and columns of each table (default: 4)')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.2,
+                        help='Fraction of runs repeating a shared phrase (default: 0.2)')
+    parser.add_argument('--latency', type=float, default=0.05, help='Fake LLM seconds per call (default: 0.05)')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='Random extra fake LLM seconds per call, up to this value (default: 0)')
+    parser.add_argument('--tlang', default='fr', help='Target language passed to the translator (default: fr)')
+    parser.add_argument('--paragraph-mode', action='store_true', help='Translate in paragraph mode')
+    parser.add_argument('--use-cache', action='store_true',
+                        help='Keep the translation memory between repeats instead of starting cold')
+    parser.add_argument('--repeat', type=int, default=1, help='Number of timed runs (default: 1)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed of the deck and the fake LLM (default: 42)')
+    parser.add_argument('--output', help='Path of the JSON results file')
+    parser.add_argument('--compare', help='JSON results file of an earlier run to compare against')
+    parser.add_argument('--verbose', action='store_true', help='Show the translator log')
+    return parser.parse_args()
+
+
+class FakeResponse:
+    """Minimal stand-in for a LangChain chat message."""
+
+    def __init__(self, content: str):
+        self.content = content
+
+
+class FakeChatModel:
+    """Deterministic local chat model with configurable latency and jitter.
+
+    Single texts are "translated" by upper-casing them; numbered JSON batches are answered
+    item by item. Inline span markers are kept, so paragraph mode works as with a real model.
+    """
+
+    def __init__(self, latency: float, jitter: float, seed: int):
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.calls = 0
+        self.items = 0
+
+    @staticmethod
+    def translate(text: str) -> str:
+        """Return the fake translation of one text, leaving the span markers untouched."""
+        return ''.join(
+            piece if translator.MARKER_PATTERN.fullmatch(piece) else piece.upper()
+            for piece in re.split(r'(</?s\d+>)', text)
+        )
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(self.latency + self.random.uniform(0, self.jitter))
+
+        content = messages[-1]["content"]
+        try:
+            batch = json.loads(content)
+        except json.JSONDecodeError:
+            batch = None
+        if isinstance(batch, dict):
+            self.items += len(batch)
+            return FakeResponse(json.dumps({key: self.translate(text) for key, text in batch.items()},
+                                           ensure_ascii=False))
+        self.items += 1
+        return FakeResponse(self.translate(content))
+
+
+def make_sentence(rng: random.Random, length: int) -> str:
+    """Return a random sentence of vocabulary words."""
+    return ' '.join(rng.choice(WORDS) for _ in range(length)).capitalize()
+
+
+def generate_deck(path: str, args) -> dict:
+    """Generate a synthetic deck and return its shape counts.
+
+    Args:
+        path (str): Path the deck is saved to
+        args: Parsed benchmark arguments
+
+    Returns:
+        dict: Number of slides, shapes, tables and text runs in the deck
+    """
+    rng = random.Random(args.seed)
+    shared_phrases = [make_sentence(rng, 4) for _ in range(20)]
+
+    def next_text():
+        if rng.random() < args.duplicate_ratio:
+            return rng.choice(shared_phrases)
+        return make_sentence(rng, rng.randint(3, 10))
+
+    presentation = Presentation()
+    blank_layout = presentation.slide_layouts[6]
+    runs = 0
+    for _ in range(args.slides):
+        slide = presentation.slides.add_slide(blank_layout)
+        for shape_index in range(args.shapes):
+            text_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5 + shape_index * 1.2), Inches(9), Inches(1))
+            text_frame = text_box.text_frame
+            for paragraph_index in range(args.paragraphs):
+                paragraph = text_frame.paragraphs[0] if paragraph_index == 0 else text_frame.add_paragraph()
+                for run_index in range(args.runs):
+                    run = paragraph.add_run()
+                    run.text = next_text() + ' '
+                    run.font.bold = run_index % 2 == 1
+                    run.font.size = Pt(14)
+                    runs += 1
+
+        for table_index in range(args.tables):
+            size = args.table_size
+            table = slide.shapes.add_table(size, size, Inches(0.5), Inches(5 + table_index * 0.5),
+                                           Inches(9), Inches(2)).table
+            for row in range(size):
+                for column in range(size):
+                    table.cell(row, column).text = next_text()
+                    runs += 1
+
+    presentation.save(path)
+    return {
+        'slides': args.slides,
+        'shapes': args.slides * args.shapes,
+        'tables': args.slides * args.tables,
+        'runs': runs,
+        'file_bytes': os.path.getsize(path),
+    }
+
+
+def get_peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MB."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    except ImportError:
+        import psutil
+        return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+
+
+async def run_once(deck_path: str, fake_model: FakeChatModel, args) -> dict:
+    """Translate the deck once and measure the run."""
+    if not args.use_cache:
+        translator.translation_memory.clear()
+    calls_before = fake_model.calls
+    items_before = fake_model.items
+    summary = {}
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    log = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with log:
+        await translator.translate_ppt_file(deck_path, 'English', args.tlang, use_cache=True,
+                                            summary=summary, paragraph_mode=args.paragraph_mode)
+    wall_seconds = time.perf_counter() - wall_start
+    cpu_seconds = time.process_time() - cpu_start
+
+    return {
+        'wall_seconds': round(wall_seconds, 3),
+        'cpu_seconds': round(cpu_seconds, 3),
+        'llm_calls': fake_model.calls - calls_before,
+        'llm_items': fake_model.items - items_before,
+        'summary': summary,
+    }
+
+
+def compare_results(current: dict, baseline: dict) -> None:
+    """Print the change of the compared metrics against an earlier run."""
+    print(f"\nComparison with {baseline.get('timestamp', 'baseline')}:")
+    for metric in COMPARED_METRICS:
+        old = baseline.get('results', {}).get(metric)
+        new = current['results'][metric]
+        if not old:
+            print(f"  {metric:<14} {new} (no baseline)")
+            continue
+        change = (new - old) / old * 100
+        print(f"  {metric:<14} {old} -> {new} ({change:+.1f}%)")
+
+
+async def main():
+    args = parse_args()
+    output_path = os.path.abspath(args.output) if args.output else None
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+
+    # Keep the translator's output, translation memory and journals out of the repository
+    work_dir = tempfile.mkdtemp(prefix='ppt_benchmark_')
+    os.chdir(work_dir)
+    deck_path = os.path.join(work_dir, 'benchmark_deck.pptx')
+    deck = generate_deck(deck_path, args)
+    print(f"Generated deck: {deck['slides']} slide(s), {deck['runs']} run(s), {deck['file_bytes']} bytes")
+
+    fake_model = FakeChatModel(args.latency, args.jitter, args.seed)
+    translator.get_chat_model = lambda model_name=None: fake_model
+
+    runs = []
+    try:
+        for index in range(args.repeat):
+            run = await run_once(deck_path, fake_model, args)
+            runs.append(run)
+            print(f"Run {index + 1}/{args.repeat}: {run['wall_seconds']}s wall, {run['cpu_seconds']}s CPU, "
+                  f"{run['llm_calls']} LLM call(s) for {run['llm_items']} item(s)")
+        engine = translator.select_engine(deck_path)
+    finally:
+        os.chdir(os.path.dirname(work_dir))
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    best = min(runs, key=lambda run: run['wall_seconds'])
+    results = {
+        'wall_seconds': best['wall_seconds'],
+        'cpu_seconds': best['cpu_seconds'],
+        'cpu_us_per_run': round(best['cpu_seconds'] / max(1, deck['runs']) * 1e6, 1),
+        'llm_calls': best['llm_calls'],
+        'llm_items': best['llm_items'],
+        'peak_rss_mb': get_peak_rss_mb(),
+    }
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'parameters': {key: value for key, value in vars(args).items()
+                       if key not in ('output', 'compare', 'verbose')},
+        'settings': {
+            'batch_max_input_tokens': translator.BATCH_MAX_INPUT_TOKENS,
+            'batch_max_output_tokens': translator.BATCH_MAX_OUTPUT_TOKENS,
+            'batch_max_items': translator.BATCH_MAX_ITEMS,
+            'max_concurrency': translator.MAX_CONCURRENCY,
+            'engine': engine,
+        },
+        'deck': deck,
+        'results': results,
+        'runs': runs,
+    }
+
+    print(f"\nBest of {args.repeat}: {results['wall_seconds']}s wall, {results['cpu_seconds']}s CPU "
+          f"({results['cpu_us_per_run']}us per run), {results['llm_calls']} LLM call(s), "
+          f"peak RSS {results['peak_rss_mb']} MB")
+
+    if compare_path:
+        with open(compare_path, encoding='utf-8') as f:
+            compare_results(report, json.load(f))
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"Results saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())